@@ -0,0 +1,87 @@
+# bench_clean_and_engineer_data.py
+# date: 2026-10-18
+
+import click
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.clean_and_engineer_data import clean_and_engineer_data
+
+
+def legacy_clean_and_engineer_data(df):
+    # Row-wise implementation that clean_and_engineer_data replaced, kept as the baseline
+    df = df.rename(columns={
+        'Temperature(°C)': 'Temperature',
+        'Humidity(%)': 'Humidity',
+        'Rainfall(mm)': 'Rainfall',
+        'Snowfall (cm)': 'Snowfall',
+        'Wind speed (m/s)': 'Wind speed',
+        'Visibility (10m)': 'Visibility',
+        'Solar Radiation (MJ/m2)': 'Radiation',
+        'Dew point temperature(°C)': 'Dew point temperature'
+    })
+    df['Date'] = pd.to_datetime(df['Date'], format='mixed')
+    df['Year'] = df['Date'].dt.year
+    df['Month'] = df['Date'].dt.month
+    df['Day'] = df['Date'].dt.day
+    df['Weekday'] = df['Date'].dt.weekday
+    df.drop(['Date'], axis=1, inplace=True)
+    df['Seasons'] = df['Seasons'].astype(str)
+    df['Holiday'] = df['Holiday'].apply(lambda x: 1 if x == "Holiday" else 0)
+    df['Functioning Day'] = df['Functioning Day'].apply(lambda x: 1 if x == "Yes" else 0)
+    return df
+
+
+def make_raw_data(n_rows, seed):
+    # Raw-shaped data with the columns and categorical levels of SeoulBikeData.csv,
+    # laid out as many stations each reporting hourly over the same year
+    rng = np.random.default_rng(seed)
+    days = pd.date_range("2017-12-01", "2018-11-30", freq="D").strftime("%d/%m/%Y").to_numpy()
+    dates = days[(np.arange(n_rows) // 24) % len(days)]
+    return pd.DataFrame({
+        'Date': dates,
+        'Rented Bike Count': rng.integers(0, 3500, n_rows),
+        'Hour': np.tile(np.arange(24), n_rows // 24 + 1)[:n_rows],
+        'Temperature(°C)': rng.normal(12.9, 11.9, n_rows).round(1),
+        'Humidity(%)': rng.integers(0, 99, n_rows),
+        'Wind speed (m/s)': rng.gamma(2.0, 0.9, n_rows).round(1),
+        'Visibility (10m)': rng.integers(27, 2000, n_rows),
+        'Dew point temperature(°C)': rng.normal(4.1, 13.1, n_rows).round(1),
+        'Solar Radiation (MJ/m2)': rng.exponential(0.57, n_rows).round(2),
+        'Rainfall(mm)': rng.exponential(0.15, n_rows).round(1),
+        'Snowfall (cm)': rng.exponential(0.08, n_rows).round(1),
+        'Seasons': rng.choice(["Winter", "Spring", "Summer", "Autumn"], n_rows),
+        'Holiday': rng.choice(["Holiday", "No Holiday"], n_rows, p=[0.05, 0.95]),
+        'Functioning Day': rng.choice(["Yes", "No"], n_rows, p=[0.97, 0.03])
+    })
+
+
+def time_function(func, df):
+    start = time.perf_counter()
+    func(df.copy())
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--rows', type=int, multiple=True, default=[1_000_000, 10_000_000],
+              help="Number of rows to benchmark, can be given several times")
+@click.option('--skip-legacy', is_flag=True, help="Only time the vectorized implementation")
+@click.option('--seed', type=int, help="Random seed", default=522)
+def main(rows, skip_legacy, seed):
+    '''Times clean_and_engineer_data against the previous row-wise implementation.'''
+    for n_rows in rows:
+        df = make_raw_data(n_rows, seed)
+        vectorized = time_function(clean_and_engineer_data, df)
+        if skip_legacy:
+            print(f"{n_rows:>12,} rows  vectorized {vectorized:8.2f}s")
+            continue
+        legacy = time_function(legacy_clean_and_engineer_data, df)
+        print(f"{n_rows:>12,} rows  legacy {legacy:8.2f}s  vectorized {vectorized:8.2f}s  "
+              f"speedup {legacy / vectorized:6.1f}x")
+
+
+if __name__ == '__main__':
+    main()
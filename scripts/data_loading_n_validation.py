@@ -6,13 +6,15 @@ import zipfile
 import io
 import requests
 import pandas as pd
-import numpy as np
-import pandera as pa
 from deepchecks.tabular import Dataset
 from deepchecks.checks import FeatureLabelCorrelation, FeatureFeatureCorrelation
 from scipy.stats import skew
 import click
 import warnings
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.stream_ingest import read_zip_streaming, validate_csv_in_chunks
+from src.data_validation import data_validation
 
 warnings.filterwarnings(
     "ignore",
@@ -50,35 +52,8 @@ def validate_csv_schema(file_path):
     except Exception as e:
         raise ValueError(f"❌ Error reading the CSV file: {e}")
 
-    # Define Pandera schema
-    schema = pa.DataFrameSchema(
-        {
-            "Date": pa.Column(str),
-            "Rented Bike Count": pa.Column(int, pa.Check.between(0, np.inf)),
-            "Hour": pa.Column(int, pa.Check.between(0, 23)),
-            "Temperature(°C)": pa.Column(float),
-            "Humidity(%)": pa.Column(int, pa.Check.between(0, 100)),
-            "Wind speed (m/s)": pa.Column(float),
-            "Visibility (10m)": pa.Column(int),
-            "Dew point temperature(°C)": pa.Column(float),
-            "Solar Radiation (MJ/m2)": pa.Column(float),
-            "Rainfall(mm)": pa.Column(float,
-                                      pa.Check(lambda s: s.isna().mean() <= 0.05, element_wise=False,
-                                               error="Too many null values in 'Rainfall(mm)' column."),
-                                      nullable=True),
-            "Snowfall (cm)": pa.Column(float),
-            "Seasons": pa.Column(str, pa.Check.isin(["Winter", "Summer", "Autumn", "Spring"])),
-            "Holiday": pa.Column(str, pa.Check.isin(["Holiday", "No Holiday"])),
-            "Functioning Day": pa.Column(str, pa.Check.isin(["Yes", "No"]))
-        },
-        checks=[
-            pa.Check(lambda df: ~df.duplicated().any(), error="Duplicate rows found."),
-            pa.Check(lambda df: ~(df.isna().all(axis=1)).any(), error="Empty rows found.")
-        ]
-    )
-
     # Validate schema
-    df = schema.validate(df, lazy=True).drop_duplicates().dropna(how="all")
+    df = data_validation(df)
     print("✅ CSV passed  data validation. 3-8")
     return df
 
@@ -119,15 +94,27 @@ def validate_additional_checks(df):
 @click.command()
 @click.option('--url', type=str, help="URL of the dataset to be downloaded.")
 @click.option('--write_to', type=str, default="../data", help="Directory to save and validate raw data.")
-def main(url, write_to):
+@click.option('--chunksize', type=int, default=None,
+              help="Stream the download to disk and validate the CSV in chunks of this many rows.")
+@click.option('--sample_size', type=int, default=10_000,
+              help="Number of rows sampled for the additional checks in streaming mode.")
+def main(url, write_to, chunksize, sample_size):
 
 
     # Step 1: Download and extract ZIP file
     raw_data_dir = os.path.join(write_to)
-    csv_path = read_zip(url, raw_data_dir)
+    if chunksize:
+        csv_path = read_zip_streaming(url, raw_data_dir)
+    else:
+        csv_path = read_zip(url, raw_data_dir)
 
     # Step 2: Validate CSV schema
-    df = validate_csv_schema(csv_path)
+    if chunksize:
+        df, summary = validate_csv_in_chunks(csv_path, chunksize=chunksize, sample_size=sample_size)
+        print(f"✅ CSV passed  data validation in {summary['n_chunks']} chunks "
+              f"({summary['n_rows']} rows). 3-8")
+    else:
+        df = validate_csv_schema(csv_path)
 
     # Step 3: Perform additional data validation checks
     df = validate_additional_checks(df)
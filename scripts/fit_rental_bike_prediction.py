@@ -3,14 +3,9 @@
 
 import click
 import os
-import numpy as np
-import pandas as pd
-import pickle
-from sklearn import set_config
-from sklearn.pipeline import make_pipeline
-from sklearn.model_selection import RandomizedSearchCV
-from sklearn.linear_model import Ridge
-from sklearn.tree import DecisionTreeRegressor
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.fit_model import fit_model
 
 
 @click.command()
@@ -18,63 +13,15 @@ from sklearn.tree import DecisionTreeRegressor
 @click.option('--preprocessor', type=str, help="Path to preprocessor object")
 @click.option('--pipeline-to', type=str, help="Path to directory where the pipeline object will be written to")
 @click.option('--seed', type=int, help="Random seed", default=123)
+@click.option('--n-jobs', type=int, help="Number of worker processes for the hyperparameter searches (-1 for all cores)", default=None)
+@click.option('--cache-dir', type=str, help="Optional directory where the per-fold preprocessed data is cached on disk", default=None)
+@click.option('--sparse', is_flag=True, help="Feed Ridge a sparse one-hot encoded matrix instead of a dense one")
 
-def main(training_data, preprocessor, pipeline_to, seed):
+def main(training_data, preprocessor, pipeline_to, seed, n_jobs, cache_dir, sparse):
     '''Fits a rental bike classiier to the training data and saves the
     pipeline object.'''
-    np.random.seed(seed)
-    set_config(transform_output="pandas")
-
-    # read in data & preprocessor
-    rental_bike_train = pd.read_csv(training_data)
-    rental_bike_preprocessor = pickle.load(open(preprocessor, "rb"))
-
-    # Ridge Regression Pipeline
-    ridge_pipeline = make_pipeline(
-        rental_bike_preprocessor,
-        Ridge()
-    )
-
-    # Decision Tree Pipeline
-    tree_pipeline = make_pipeline(
-        rental_bike_preprocessor,
-        DecisionTreeRegressor(random_state=42)
-    )
-
-    # Define parameter grids for RandomizedSearchCV
-    ridge_param_grid = {
-        'ridge__alpha': np.logspace(-3, 3, 10)
-    }
-
-    tree_param_grid = {
-        'decisiontreeregressor__max_depth': [None, 10, 20, 30, 40],
-        'decisiontreeregressor__min_samples_split': [2, 5, 10],
-        'decisiontreeregressor__min_samples_leaf': [1, 2, 4]
-    }
-
-    # Perform RandomizedSearchCV for both pipelines
-    ridge_search = RandomizedSearchCV(
-        estimator=ridge_pipeline,
-        param_distributions =  ridge_param_grid,
-        cv = 10, n_iter = 10, random_state=seed)
-
-    tree_search = RandomizedSearchCV(
-        estimator=tree_pipeline,
-        param_distributions =  tree_param_grid,
-        cv = 10, n_iter = 10, random_state=seed)
-        
-    # Fit models
-    ridge_fit = ridge_search.fit(rental_bike_train.drop(
-    "Rented Bike Count", axis=1), rental_bike_train["Rented Bike Count"])
-    tree_fit = tree_search.fit(rental_bike_train.drop(
-    "Rented Bike Count", axis=1), rental_bike_train["Rented Bike Count"])
-
-
-    with open(os.path.join(pipeline_to, "ridge_pipeline.pickle"), 'wb') as f:
-        pickle.dump(ridge_fit, f)
-
-    with open(os.path.join(pipeline_to, "tree_pipeline.pickle"), 'wb') as f:
-        pickle.dump(tree_fit, f)
+    fit_model(training_data, preprocessor, pipeline_to, seed, n_jobs=n_jobs,
+              cache_dir=cache_dir, sparse=sparse)
 
 if __name__ == '__main__':
     main()
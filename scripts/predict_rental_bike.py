@@ -0,0 +1,25 @@
+# predict_rental_bike.py
+# date: 2026-10-18
+
+import click
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.predict import predict_in_chunks
+
+
+@click.command()
+@click.option('--pipeline', type=str, help="Path to the fitted pipeline object")
+@click.option('--features', type=str, help="Path to the processed features to score (CSV or Parquet)")
+@click.option('--predictions-to', type=str, help="Path to the CSV file where the predictions will be written to")
+@click.option('--chunksize', type=int, help="Number of rows scored at a time", default=100_000)
+@click.option('--n-jobs', type=int, help="Number of worker processes (-1 for all cores)", default=None)
+def main(pipeline, features, predictions_to, chunksize, n_jobs):
+    '''Scores a feature file of any size with a fitted rental bike pipeline,
+    chunk by chunk, and writes the predictions as they are computed.'''
+    stats = predict_in_chunks(pipeline, features, predictions_to, chunksize=chunksize, n_jobs=n_jobs)
+    print(f"Scored {stats['rows']:,} rows in {stats['chunks']} chunks "
+          f"({stats['seconds']:.2f}s, {stats['rows_per_sec']:,.0f} rows/sec)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+# serve_rental_bike_prediction.py
+# date: 2026-10-18
+
+import click
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.inference_server import load_model, make_server
+
+
+@click.command()
+@click.option('--pipeline-from-ridge', type=str, help="Path to the ridge fit pipeline object", default=None)
+@click.option('--pipeline-from-tree', type=str, help="Path to the tree fit pipeline object", default=None)
+@click.option('--host', type=str, help="Address to bind", default="127.0.0.1")
+@click.option('--port', type=int, help="Port to listen on", default=8000)
+@click.option('--max-batch-size', type=int, help="Maximum number of records predicted together", default=256)
+@click.option('--max-wait-ms', type=float, help="Maximum time in milliseconds to wait for more requests to batch", default=5)
+def main(pipeline_from_ridge, pipeline_from_tree, host, port, max_batch_size, max_wait_ms):
+    '''Serves hourly rental bike forecasts over HTTP from the fitted pipelines.'''
+    models = {}
+    if pipeline_from_ridge:
+        models["ridge"] = load_model(pipeline_from_ridge)
+    if pipeline_from_tree:
+        models["tree"] = load_model(pipeline_from_tree)
+    if not models:
+        raise click.UsageError("At least one pipeline must be given.")
+
+    server = make_server(models, host=host, port=port,
+                         max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    print(f"Serving {', '.join(models)} on http://{host}:{server.server_address[1]} "
+          "(POST /predict, GET /metrics)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -11,14 +11,20 @@ from sklearn import set_config
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import OneHotEncoder, StandardScaler
 from sklearn.compose import make_column_transformer
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.processed_data import write_processed, DATA_FORMATS
+from src.clean_and_engineer_data import clean_and_engineer_data
 
 @click.command()
 @click.option('--raw_data', type=str, help="Path to raw data")
 @click.option('--data_to', type=str, help="Path to directory where processed data will be written to")
 @click.option('--preprocessor_to', type=str, help="Path to directory where the preprocessor object will be written to")
 @click.option('--seed', type=int, help="Random seed", default=123)
+@click.option('--data_format', type=click.Choice(list(DATA_FORMATS)), default="csv",
+              help="File format of the processed train and test sets")
 
-def main(raw_data, data_to, preprocessor_to, seed):
+def main(raw_data, data_to, preprocessor_to, seed, data_format):
     '''
     This script reads in the cleaned up data and splits the data to train and test sets. The data gets
     preprocessed to be ready for exploratory data anaylsis and saves the preprocessor used in the model
@@ -28,39 +34,15 @@ def main(raw_data, data_to, preprocessor_to, seed):
     set_config(transform_output="pandas")
     df = pd.read_csv(raw_data, encoding="latin-1")
 
-    # renaming columns
-    df = df.rename(columns={
-    'Temperature(°C)': 'Temperature',
-    'Humidity(%)': 'Humidity',
-    'Rainfall(mm)': 'Rainfall',
-    'Snowfall (cm)': 'Snowfall',
-    'Wind speed (m/s)': 'Wind speed',
-    'Visibility (10m)': 'Visibility',
-    'Solar Radiation (MJ/m2)': 'Radiation',
-    'Dew point temperature(°C)': 'Dew point temperature'})
-
-    # Convert the Date column in Datetime Dtype
-    df['Date'] = pd.to_datetime(df['Date'], format='mixed')
-
-    # Extract features from the Date column
-    df['Year'] = df['Date'].dt.year
-    df['Month'] = df['Date'].dt.month
-    df['Day'] = df['Date'].dt.day
-    df['Weekday'] = df['Date'].dt.weekday
-    df = df.drop(['Date'], axis=1)  # Exclude unwanted columns
-
-    # Convert to categorical
-    df['Seasons'] = df['Seasons'].astype(str)
-
-    # Converting to binary for EDA and for values to feed into model
-    df['Holiday'] = df['Holiday'].apply(lambda x: 1 if x == "Holiday" else 0)
-    df['Functioning Day'] = df['Functioning Day'].apply(
-    lambda x: 1 if x == "Yes" else 0)
+    # renaming columns, extracting date features and binary encoding
+    # for EDA and for values to feed into model
+    df = clean_and_engineer_data(df)
 
     # train-test split
     bike_train, bike_test = train_test_split(df, test_size=0.3, random_state=123)
-    bike_train.to_csv(os.path.join(data_to, "bike_train.csv"), index=False)
-    bike_test.to_csv(os.path.join(data_to, "bike_test.csv"), index=False)
+    extension = DATA_FORMATS[data_format]
+    write_processed(bike_train, os.path.join(data_to, f"bike_train{extension}"))
+    write_processed(bike_test, os.path.join(data_to, f"bike_test{extension}"))
 
     # Define column transformer for preprocessing
     bike_preprocessor = make_column_transformer(
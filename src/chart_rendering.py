@@ -0,0 +1,118 @@
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import altair as alt
+import vl_convert as vlc
+
+# vl-convert's name of the Vega-Lite version Altair targets (e.g. 'v5_14')
+VL_VERSION = "_".join(alt.SCHEMA_VERSION.split(".")[:2])
+
+MANIFEST_NAME = ".render_manifest.json"
+
+
+def spec_hash(spec, scale_factor=2.0):
+    """
+    Hashes a Vega-Lite spec, including its inline data, and the render settings.
+
+    Parameters:
+    ----------
+    spec : dict
+        Vega-Lite spec, e.g. from `alt.Chart.to_dict()`.
+    scale_factor : float, optional
+        Scale factor of the rendered PNG. Default is 2.0.
+
+    Returns:
+    -------
+    str
+        Hex digest identifying the rendered image.
+    """
+    payload = json.dumps({"spec": spec, "scale_factor": scale_factor, "vl_version": VL_VERSION},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _render_png(spec, output_path, scale_factor):
+    # Same conversion as `Chart.save(..., scale_factor=...)` with the vl-convert engine
+    png = vlc.vegalite_to_png(spec, vl_version=VL_VERSION, scale=scale_factor)
+    with open(output_path, "wb") as f:
+        f.write(png)
+    return output_path
+
+
+def _read_manifest(manifest_path):
+    if not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def render_charts(charts, plot_to, prefix="", n_jobs=None, scale_factor=2.0):
+    """
+    Renders Altair charts to PNG files, in parallel and skipping unchanged charts.
+
+    The Vega-Lite spec of every chart is built first (in the calling process).
+    Charts whose spec, inline data and scale factor hash to the value recorded
+    for their file in `<plot_to>/.render_manifest.json` during the previous run
+    are skipped, provided the file still exists. The remaining specs are
+    rasterized with vl-convert, in a process pool when `n_jobs` > 1.
+
+    Parameters:
+    ----------
+    charts : dict of str to altair.Chart
+        Charts keyed by file name without extension.
+    plot_to : str
+        Directory where the PNG files are written.
+    prefix : str, optional
+        Prefix added to every file name. Default is ''.
+    n_jobs : int, optional
+        Number of worker processes, -1 uses all cores. Default is None (serial).
+    scale_factor : float, optional
+        Scale factor of the PNG files. Default is 2.0.
+
+    Returns:
+    -------
+    dict
+        The file names that were 'rendered' and 'skipped'.
+    """
+    manifest_path = os.path.join(plot_to, MANIFEST_NAME)
+    manifest = _read_manifest(manifest_path)
+
+    # Like `Chart.save`, allow charts with more rows than Altair's MaxRowsError limit
+    with alt.data_transformers.disable_max_rows():
+        specs = {f"{prefix}{name}.png": chart.to_dict() for name, chart in charts.items()}
+
+    jobs = {}
+    skipped = []
+    for file_name, spec in specs.items():
+        key = spec_hash(spec, scale_factor)
+        if manifest.get(file_name) == key and os.path.exists(os.path.join(plot_to, file_name)):
+            skipped.append(file_name)
+        else:
+            jobs[file_name] = (spec, key)
+
+    if n_jobs is not None and n_jobs != 1 and len(jobs) > 1:
+        max_workers = min(len(jobs), os.cpu_count() if n_jobs == -1 else n_jobs)
+        # vl-convert runs its own threads, which do not survive a fork, so the
+        # workers are started fresh
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [
+                executor.submit(_render_png, spec, os.path.join(plot_to, file_name), scale_factor)
+                for file_name, (spec, _) in jobs.items()
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for file_name, (spec, _) in jobs.items():
+            _render_png(spec, os.path.join(plot_to, file_name), scale_factor)
+
+    manifest.update({file_name: key for file_name, (_, key) in jobs.items()})
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return {"rendered": list(jobs), "skipped": skipped}
@@ -1,4 +1,29 @@
+import numpy as np
 import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+
+SEASONS_DTYPE = pd.CategoricalDtype(["Winter", "Spring", "Summer", "Autumn"])
+
+
+def parse_dates(dates):
+    """
+    Parses the Date column, using the fixed day-first format of the Seoul data as a fast path.
+
+    Only the values that do not match '%d/%m/%Y' are parsed again with the
+    slower per-element 'mixed' parser.
+
+    Parameters:
+        dates (pd.Series): The raw Date column
+    Returns:
+        pd.Series: The parsed dates
+    """
+    parsed = pd.to_datetime(dates, format='%d/%m/%Y', errors='coerce')
+    failed = parsed.isna() & dates.notna()
+    if failed.any():
+        parsed[failed] = pd.to_datetime(dates[failed], format='mixed')
+    return parsed
+
+
 def clean_and_engineer_data(df):
     """
     Cleans and engineers features for the given DataFrame.
@@ -18,16 +43,48 @@ def clean_and_engineer_data(df):
         'Solar Radiation (MJ/m2)': 'Radiation',
         'Dew point temperature(°C)': 'Dew point temperature'
     })
-    # Convert the Date column to datetime and extract features
-    df['Date'] = pd.to_datetime(df['Date'], format='mixed')
-    df['Year'] = df['Date'].dt.year
-    df['Month'] = df['Date'].dt.month
-    df['Day'] = df['Date'].dt.day
-    df['Weekday'] = df['Date'].dt.weekday
+    # Convert the Date column to datetime and extract features. Hourly data repeats
+    # each date 24 times, so only the unique dates are parsed and broadcast back
+    codes, unique_dates = pd.factorize(df['Date'])
+    dates = parse_dates(pd.Series(unique_dates, dtype=object))
+    for column, attribute in [('Year', 'year'), ('Month', 'month'), ('Day', 'day'), ('Weekday', 'weekday')]:
+        values = getattr(dates.dt, attribute).to_numpy()
+        df[column] = values[codes] if (codes >= 0).all() else np.where(codes >= 0, values[codes], np.nan)
     df.drop(['Date'], axis=1, inplace=True)
     # Convert to categorical
-    df['Seasons'] = df['Seasons'].astype(str)
+    df['Seasons'] = df['Seasons'].astype(SEASONS_DTYPE)
     # Binary encoding
-    df['Holiday'] = df['Holiday'].apply(lambda x: 1 if x == "Holiday" else 0)
-    df['Functioning Day'] = df['Functioning Day'].apply(lambda x: 1 if x == "Yes" else 0)
-    return df
\ No newline at end of file
+    df['Holiday'] = (df['Holiday'].to_numpy() == "Holiday").astype(int)
+    df['Functioning Day'] = (df['Functioning Day'].to_numpy() == "Yes").astype(int)
+    return df
+
+
+class BikeFeatureEngineer(TransformerMixin, BaseEstimator):
+    """
+    scikit-learn transformer applying `clean_and_engineer_data` to raw bike data.
+
+    It is stateless, so the exact feature step used to build the processed
+    train/test splits can be put in front of a fitted pipeline for batch
+    scoring or online inference on raw records.
+    """
+
+    def fit(self, X, y=None):
+        """
+        Does nothing, the transformer has no state to learn.
+        Parameters:
+            X (pd.DataFrame): The raw data
+            y (pd.Series): Ignored
+        Returns:
+            BikeFeatureEngineer: The transformer itself
+        """
+        return self
+
+    def transform(self, X):
+        """
+        Cleans and engineers features for the given raw data.
+        Parameters:
+            X (pd.DataFrame): The raw data
+        Returns:
+            pd.DataFrame: A cleaned and engineered DataFrame
+        """
+        return clean_and_engineer_data(X)
@@ -2,6 +2,105 @@ import pandas as pd
 import pandera as pa
 import numpy as np
 
+
+def row_hashes(bike_dataframe):
+    """
+    Hashes every row of a DataFrame into a 64-bit integer in one vectorized pass.
+
+    Parameters
+    ----------
+    bike_dataframe : pandas.DataFrame
+        The DataFrame to hash.
+
+    Returns
+    ----------
+    numpy.ndarray
+        The uint64 hash of each row, ignoring the index.
+    """
+    return pd.util.hash_pandas_object(bike_dataframe, index=False).to_numpy()
+
+
+# Schema compiled once at import time and shared by every validation call.
+# Duplicates are found from a single row-hash pass instead of df.duplicated()
+BIKE_SCHEMA = pa.DataFrameSchema(
+    {
+        "Date": pa.Column(str),
+        "Rented Bike Count": pa.Column(int, pa.Check.between(0, np.inf)),
+        "Hour": pa.Column(int, pa.Check.between(0, 23)),
+        "Temperature(°C)": pa.Column(float),
+        "Humidity(%)": pa.Column(int, pa.Check.between(0, 100)),
+        "Wind speed (m/s)": pa.Column(float),
+        "Visibility (10m)": pa.Column(int),
+        "Dew point temperature(°C)": pa.Column(float),
+        "Solar Radiation (MJ/m2)": pa.Column(float),
+        "Rainfall(mm)": pa.Column(float,
+                                  pa.Check(lambda s: s.isna().mean() <= 0.05, element_wise=False,
+                                           error="Too many null values in 'Rainfall(mm)' column."),
+                                  nullable=True),
+        "Snowfall (cm)": pa.Column(float),
+        "Seasons": pa.Column(str, pa.Check.isin(["Winter", "Summer", "Autumn", "Spring"])),
+        "Holiday": pa.Column(str, pa.Check.isin(["Holiday", "No Holiday"])),
+        "Functioning Day": pa.Column(str, pa.Check.isin(["Yes", "No"]))
+    },
+    checks=[
+        pa.Check(lambda bike_dataframe: ~pd.Series(row_hashes(bike_dataframe), index=bike_dataframe.index).duplicated(),
+                 error="Duplicate rows found."),
+        pa.Check(lambda bike_dataframe: ~bike_dataframe.isna().all(axis=1), error="Empty rows found.")
+    ]
+)
+
+# Column types and ranges only, for validating one chunk of a larger data set.
+# The null fraction, duplicate and empty row checks span all chunks, see validate_in_chunks
+CHUNK_SCHEMA = pa.DataFrameSchema(BIKE_SCHEMA.columns).update_column("Rainfall(mm)", checks=[])
+
+
+class RowHashIndex:
+    """
+    Sorted array of the row hashes seen so far, used to find duplicates across chunks.
+
+    Membership is checked with a binary search and new hashes are merged in with
+    a stable sort of two sorted runs, so each chunk costs about O(n log n) in its
+    own size instead of re-hashing the whole history. Memory grows by 8 bytes per
+    unique row.
+    """
+
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def contains(self, hashes):
+        """
+        Checks which of the given hashes have already been seen.
+
+        Parameters
+        ----------
+        hashes : numpy.ndarray
+            uint64 row hashes.
+
+        Returns
+        ----------
+        numpy.ndarray
+            Boolean mask, True where the hash is in the index.
+        """
+        if len(self.hashes) == 0:
+            return np.zeros(len(hashes), dtype=bool)
+        positions = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+        return self.hashes[positions] == hashes
+
+    def add(self, hashes):
+        """
+        Adds hashes that are not in the index yet.
+
+        Parameters
+        ----------
+        hashes : numpy.ndarray
+            uint64 row hashes, without duplicates or hashes already in the index.
+        """
+        self.hashes = np.sort(np.concatenate([self.hashes, np.sort(hashes)]), kind="stable")
+
+
 def data_validation(bike_dataframe):
     """
     Validates the input rental bike data in the form of a pandas dataframe
@@ -44,34 +143,66 @@ def data_validation(bike_dataframe):
     if bike_dataframe.empty:
         raise ValueError("Dataframe must contain observations.")
 
-    # Define Pandera schema
-    schema = pa.DataFrameSchema(
-        {
-            "Date": pa.Column(str),
-            "Rented Bike Count": pa.Column(int, pa.Check.between(0, np.inf)),
-            "Hour": pa.Column(int, pa.Check.between(0, 23)),
-            "Temperature(°C)": pa.Column(float),
-            "Humidity(%)": pa.Column(int, pa.Check.between(0, 100)),
-            "Wind speed (m/s)": pa.Column(float),
-            "Visibility (10m)": pa.Column(int),
-            "Dew point temperature(°C)": pa.Column(float),
-            "Solar Radiation (MJ/m2)": pa.Column(float),
-            "Rainfall(mm)": pa.Column(float,
-                                      pa.Check(lambda s: s.isna().mean() <= 0.05, element_wise=False,
-                                               error="Too many null values in 'Rainfall(mm)' column."),
-                                      nullable=True),
-            "Snowfall (cm)": pa.Column(float),
-            "Seasons": pa.Column(str, pa.Check.isin(["Winter", "Summer", "Autumn", "Spring"])),
-            "Holiday": pa.Column(str, pa.Check.isin(["Holiday", "No Holiday"])),
-            "Functioning Day": pa.Column(str, pa.Check.isin(["Yes", "No"]))
-        },
-        checks=[
-            pa.Check(lambda bike_dataframe: ~bike_dataframe.duplicated().any(), error="Duplicate rows found."),
-            pa.Check(lambda bike_dataframe: ~(bike_dataframe.isna().all(axis=1)).any(), error="Empty rows found.")
-        ]
-    )
-
-    # Validate schema
-    bike_dataframe = schema.validate(bike_dataframe, lazy=True).drop_duplicates().dropna(how="all")
-
-    return bike_dataframe
\ No newline at end of file
+    # Validate schema. Validation fails on duplicated or empty rows, so
+    # the validated DataFrame needs no further deduplication
+    bike_dataframe = BIKE_SCHEMA.validate(bike_dataframe, lazy=True)
+
+    return bike_dataframe
+
+
+def validate_in_chunks(chunks, hash_index=None):
+    """
+    Validates rental bike data arriving in chunks and reports errors chunk by chunk.
+
+    Each chunk is checked against `CHUNK_SCHEMA`. Every row is hashed once and
+    the hashes are used both to count the rows that duplicate an earlier row
+    (in the same chunk or any previous one) and to drop them from the chunk,
+    so the cost per chunk does not grow with the history already validated.
+
+    Parameters
+    ---------
+    chunks : iterable of pandas.DataFrame
+        The chunks of rental bike data, e.g. from `pd.read_csv(..., chunksize=...)`.
+    hash_index : RowHashIndex, optional
+        Hashes of rows validated earlier (e.g. previous hourly feeds). A new,
+        empty index is used if not given.
+
+    Yields
+    ----------
+    tuple of (pandas.DataFrame, dict)
+        The chunk without duplicated and completely empty rows, and its report
+        with the keys:
+            - 'chunk': position of the chunk
+            - 'n_rows': number of rows in the chunk
+            - 'duplicate_rows': number of rows already seen
+            - 'empty_rows': number of completely empty rows
+            - 'null_counts': number of missing values per column
+            - 'failure_cases': pandera failure cases (empty if the chunk is valid)
+            - 'error': the pandera.errors.SchemaErrors raised, or None
+    """
+    hash_index = RowHashIndex() if hash_index is None else hash_index
+    for position, chunk in enumerate(chunks):
+        error = None
+        failure_cases = pd.DataFrame()
+        try:
+            CHUNK_SCHEMA.validate(chunk, lazy=True)
+        except pa.errors.SchemaErrors as e:
+            error = e
+            failure_cases = e.failure_cases
+
+        nulls = chunk.isna()
+        empty = nulls.all(axis=1).to_numpy()
+        hashes = row_hashes(chunk)
+        duplicated = pd.Series(hashes).duplicated().to_numpy() | hash_index.contains(hashes)
+        hash_index.add(hashes[~duplicated])
+
+        report = {
+            "chunk": position,
+            "n_rows": len(chunk),
+            "duplicate_rows": int(duplicated.sum()),
+            "empty_rows": int(empty.sum()),
+            "null_counts": nulls.sum(),
+            "failure_cases": failure_cases,
+            "error": error
+        }
+        yield chunk[~(duplicated | empty)], report
@@ -2,21 +2,73 @@ import os
 import numpy as np
 import pandas as pd
 import pickle
-from sklearn import set_config
+from concurrent.futures import ThreadPoolExecutor
+from sklearn import set_config, get_config, config_context
 from sklearn.pipeline import make_pipeline
 from sklearn.model_selection import RandomizedSearchCV
 from sklearn.linear_model import Ridge
 from sklearn.tree import DecisionTreeRegressor
+from src.transform_cache import TransformCache
+from src.sparse_preprocessing import make_sparse_preprocessor, sparse_memory_report
+from src.processed_data import read_processed
+from src.model_export import export_best_estimator
 
-def fit_model(training_data, preprocessor, pipeline_to, seed):
+
+def fit_searches(searches, X, y, n_jobs=None):
+    """
+    Fits a list of hyperparameter searches on the same training data.
+
+    When `n_jobs` is None or 1 the searches are fitted one after another on a 
+    single core. Otherwise every search is given `n_jobs` workers and the 
+    searches are launched concurrently, so all of their candidate/fold fits 
+    are fanned out over one shared process pool. The CV splits and sampled 
+    candidates only depend on each search's `random_state`, so the fitted 
+    searches are identical to the serial run.
+
+    Parameters:
+    ----------
+    searches : list of sklearn search objects
+        Unfitted search objects (e.g. RandomizedSearchCV).
+    X : pd.DataFrame
+        Training features.
+    y : pd.Series
+        Training target.
+    n_jobs : int, optional
+        Number of worker processes, -1 uses all cores. Default is None (serial).
+
+    Returns:
+    -------
+    list
+        The fitted search objects, in the same order as `searches`.
+    """
+    if n_jobs is None or n_jobs == 1:
+        return [search.fit(X, y) for search in searches]
+
+    # sklearn's global config is thread-local, so hand it over to each thread
+    config = get_config()
+
+    def _fit(search):
+        with config_context(**config):
+            return search.set_params(n_jobs=n_jobs).fit(X, y)
+
+    with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+        return list(executor.map(_fit, searches))
+
+
+def fit_model(training_data, preprocessor, pipeline_to, seed, n_jobs=None,
+              cache_transforms=True, cache_dir=None, sparse=False):
     """
     Fits a rental bike regressor model (Ridge and Decision Tree) to the provided training data 
     and saves the resulting pipelines as pickle files.
 
+    Next to the pickled search objects, the refit best pipelines are exported as
+    `ridge_model.joblib` and `tree_model.joblib`, with the search results in
+    `ridge_search.json` and `tree_search.json`.
+
     Parameters:
     ----------
     training_data : str
-        Path to the CSV file containing the training data. The dataset should include a 
+        Path to the CSV or Parquet file containing the training data. The dataset should include a 
         column 'Rented Bike Count' which will be used as the target variable.
     preprocessor : str
         Path to the preprocessor pickle file that will be used to preprocess the training data.
@@ -24,6 +76,20 @@ def fit_model(training_data, preprocessor, pipeline_to, seed):
         Path to the directory where the fitted pipelines will be saved as pickle files.
     seed : int
         Random seed used for reproducibility in model training and hyperparameter search.
+    n_jobs : int, optional
+        Number of worker processes used to run both searches in parallel, -1 uses
+        all cores. Default is None, which fits everything serially.
+    cache_transforms : bool, optional
+        Whether to fit the preprocessor once per CV fold and reuse the transformed
+        data for every Ridge and Decision Tree candidate. Default is True.
+    cache_dir : str, optional
+        Directory used to persist the per-fold transforms on disk, which also lets
+        parallel workers share them. Default is None (in-memory only).
+    sparse : bool, optional
+        Whether the Ridge pipeline should one-hot encode into a sparse CSR matrix
+        and fit with the sparse-aware `sparse_cg` solver. The Decision Tree pipeline
+        keeps the dense preprocessor. The memory saved on the training data is
+        printed. Default is False.
 
     Returns:
     -------
@@ -33,19 +99,31 @@ def fit_model(training_data, preprocessor, pipeline_to, seed):
     set_config(transform_output="pandas")
 
     # read in data & preprocessor
-    rental_bike_train = pd.read_csv(training_data)
+    rental_bike_train = read_processed(training_data)
     rental_bike_preprocessor = pickle.load(open(preprocessor, "rb"))
 
+    # Both pipelines share one cache so each fold is only preprocessed once
+    memory = TransformCache(cache_dir) if cache_transforms else None
+
     # Ridge Regression Pipeline
-    ridge_pipeline = make_pipeline(
-        rental_bike_preprocessor,
-        Ridge()
-    )
+    if sparse:
+        ridge_pipeline = make_pipeline(
+            make_sparse_preprocessor(rental_bike_preprocessor),
+            Ridge(solver="sparse_cg"),
+            memory=memory
+        )
+    else:
+        ridge_pipeline = make_pipeline(
+            rental_bike_preprocessor,
+            Ridge(),
+            memory=memory
+        )
 
     # Decision Tree Pipeline
     tree_pipeline = make_pipeline(
         rental_bike_preprocessor,
-        DecisionTreeRegressor(random_state=42)
+        DecisionTreeRegressor(random_state=42),
+        memory=memory
     )
 
     # Define parameter grids for RandomizedSearchCV
@@ -71,11 +149,24 @@ def fit_model(training_data, preprocessor, pipeline_to, seed):
         cv = 10, n_iter = 10, random_state=seed)
         
     # Fit models
-    ridge_fit = ridge_search.fit(rental_bike_train.drop(
-    "Rented Bike Count", axis=1), rental_bike_train["Rented Bike Count"])
-    tree_fit = tree_search.fit(rental_bike_train.drop(
-    "Rented Bike Count", axis=1), rental_bike_train["Rented Bike Count"])
+    X_train = rental_bike_train.drop("Rented Bike Count", axis=1)
+    ridge_fit, tree_fit = fit_searches(
+        [ridge_search, tree_search],
+        X_train,
+        rental_bike_train["Rented Bike Count"],
+        n_jobs=n_jobs
+    )
 
+    if sparse:
+        report = sparse_memory_report(ridge_fit.best_estimator_[:-1].transform(X_train))
+        print(f"Sparse preprocessing: {report['sparse_bytes']:,} bytes instead of "
+              f"{report['dense_bytes']:,} dense ({report['saved_bytes']:,} bytes saved, "
+              f"density {report['density']:.2f})")
+
+    # The saved pipelines should not depend on the cache
+    for search in [ridge_fit, tree_fit]:
+        search.estimator.set_params(memory=None)
+        search.best_estimator_.set_params(memory=None)
 
     with open(os.path.join(pipeline_to, "ridge_pipeline.pickle"), 'wb') as f:
         pickle.dump(ridge_fit, f)
@@ -83,5 +174,9 @@ def fit_model(training_data, preprocessor, pipeline_to, seed):
     with open(os.path.join(pipeline_to, "tree_pipeline.pickle"), 'wb') as f:
         pickle.dump(tree_fit, f)
 
+    # Slim, memory-mappable artifacts for evaluation and serving
+    export_best_estimator(ridge_fit, pipeline_to, "ridge")
+    export_best_estimator(tree_fit, pipeline_to, "tree")
+
     return None
 
@@ -0,0 +1,259 @@
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+from src.clean_and_engineer_data import clean_and_engineer_data
+from src.data_validation import CHUNK_SCHEMA
+from src.model_evaluation import load_pipeline
+
+# Raw columns a request record must have, i.e. a row of SeoulBikeData.csv without the target
+RAW_FEATURES = [column for column in CHUNK_SCHEMA.columns if column != "Rented Bike Count"]
+
+
+def load_model(pipeline_path):
+    """
+    Loads a fitted pipeline for serving.
+
+    Parameters:
+    ----------
+    pipeline_path : str
+        Path to the pipeline pickle file, either a fitted pipeline or a fitted
+        hyperparameter search object.
+
+    Returns:
+    -------
+    object
+        The fitted pipeline, i.e. `best_estimator_` for a search object.
+    """
+    model = load_pipeline(pipeline_path)
+    return getattr(model, "best_estimator_", model)
+
+
+class LatencyTracker:
+    """
+    Keeps the most recent request latencies and reports their percentiles.
+
+    Parameters:
+    ----------
+    window : int, optional
+        Number of most recent latencies kept. Default is 10,000.
+    """
+
+    def __init__(self, window=10_000):
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, seconds):
+        """
+        Records the latency of one request.
+
+        Parameters:
+        ----------
+        seconds : float
+            Latency of the request in seconds.
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+            self.count += 1
+
+    def summary(self):
+        """
+        Summarizes the recorded latencies.
+
+        Returns:
+        -------
+        dict
+            The number of requests and the p50/p99 latency in milliseconds
+            (None before the first request).
+        """
+        with self._lock:
+            latencies = np.array(self._latencies)
+            count = self.count
+        if len(latencies) == 0:
+            return {"requests": count, "p50_ms": None, "p99_ms": None}
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        return {"requests": count, "p50_ms": float(p50), "p99_ms": float(p99)}
+
+
+class MicroBatcher:
+    """
+    Groups concurrent prediction requests into one vectorized predict call per model.
+
+    Requests are queued and a single background thread takes as many as are
+    waiting, up to `max_batch_size` records or `max_wait_ms` after the first
+    one, runs the feature engineering and each model's `predict` once on the
+    whole batch, and hands every request its own slice of the predictions.
+
+    Parameters:
+    ----------
+    models : dict of str to object
+        Fitted pipelines keyed by the name used in the responses.
+    max_batch_size : int, optional
+        Maximum number of records predicted together. Default is 256.
+    max_wait_ms : float, optional
+        Maximum time to wait for more requests once one is queued. Default is 5.
+    """
+
+    def __init__(self, models, max_batch_size=256, max_wait_ms=5):
+        self.models = models
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.batched_records = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def predict(self, records):
+        """
+        Predicts the bike demand for raw records, batched with other waiting requests.
+
+        Parameters:
+        ----------
+        records : pd.DataFrame
+            Raw records with the columns of SeoulBikeData.csv (without the target).
+
+        Returns:
+        -------
+        dict of str to numpy.ndarray
+            The predictions of every model, in the order of `records`.
+        """
+        future = Future()
+        self._queue.put((records, future))
+        return future.result()
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        size = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _run(self):
+        set_config(transform_output="pandas")
+        while True:
+            batch = self._collect()
+            try:
+                records = pd.concat([records for records, _ in batch], ignore_index=True)
+                features = clean_and_engineer_data(records)
+                predictions = {
+                    name: model.predict(features[model.feature_names_in_])
+                    for name, model in self.models.items()
+                }
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.batched_records += len(records)
+            start = 0
+            for request_records, future in batch:
+                stop = start + len(request_records)
+                future.set_result({name: values[start:stop] for name, values in predictions.items()})
+                start = stop
+
+
+class InferenceHandler(BaseHTTPRequestHandler):
+    """
+    HTTP handler exposing `POST /predict`, `GET /metrics` and `GET /health`.
+
+    `POST /predict` takes a JSON object (or list of objects) with the raw
+    columns of SeoulBikeData.csv, or `{"records": [...]}`, and returns
+    `{"predictions": {model name: [...]}}`.
+    """
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/metrics":
+            batcher = self.server.batcher
+            metrics = self.server.latency.summary()
+            metrics["batches"] = batcher.batches
+            metrics["mean_batch_size"] = batcher.batched_records / batcher.batches if batcher.batches else None
+            self._send_json(200, metrics)
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/predict":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        start = time.perf_counter()
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            if isinstance(payload, dict):
+                payload = payload.get("records", [payload])
+            records = pd.DataFrame(payload)
+            if records.empty:
+                raise ValueError("The request must contain at least one record.")
+            missing = [column for column in RAW_FEATURES if column not in records.columns]
+            if missing:
+                raise ValueError(f"Missing columns: {missing}")
+        except (ValueError, TypeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        try:
+            predictions = self.server.batcher.predict(records)
+        except (KeyError, ValueError, TypeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        self._send_json(200, {"predictions": {name: values.tolist() for name, values in predictions.items()}})
+        self.server.latency.record(time.perf_counter() - start)
+
+    def log_message(self, format, *args):
+        # keep the console quiet under load
+        pass
+
+
+def make_server(models, host="127.0.0.1", port=8000, max_batch_size=256, max_wait_ms=5):
+    """
+    Creates the inference HTTP server. Call `serve_forever()` on it to start serving.
+
+    Parameters:
+    ----------
+    models : dict of str to object
+        Fitted pipelines keyed by the name used in the responses.
+    host : str, optional
+        Address to bind. Default is '127.0.0.1'.
+    port : int, optional
+        Port to bind, 0 picks a free port. Default is 8000.
+    max_batch_size : int, optional
+        Maximum number of records predicted together. Default is 256.
+    max_wait_ms : float, optional
+        Maximum time to wait for more requests to batch. Default is 5.
+
+    Returns:
+    -------
+    http.server.ThreadingHTTPServer
+        The server, with `batcher` and `latency` attributes.
+    """
+    server = ThreadingHTTPServer((host, port), InferenceHandler)
+    server.batcher = MicroBatcher(models, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    server.latency = LatencyTracker()
+    return server
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+
+METRICS = ["r2", "rmse", "mae", "rmsle", "mape"]
+
+# Columns of the processed test data the metrics are broken down by
+GROUP_COLUMNS = ["Hour", "Seasons", "Holiday", "Functioning Day"]
+
+
+def _row_terms(y_true, y_pred):
+    # Per-row terms whose group sums give every metric, computed once per model
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    error = y_pred - y_true
+    log_error = np.log1p(np.clip(y_pred, 0, None)) - np.log1p(y_true)
+    nonzero = y_true != 0
+    return {
+        "y": y_true,
+        "y2": y_true ** 2,
+        "error2": error ** 2,
+        "abs_error": np.abs(error),
+        "log_error2": log_error ** 2,
+        "nonzero": nonzero.astype(float),
+        "ape": np.divide(np.abs(error), np.abs(y_true), out=np.zeros_like(error), where=nonzero)
+    }
+
+
+def _aggregate(terms, codes, n_groups):
+    sums = {name: np.bincount(codes, weights=values, minlength=n_groups) for name, values in terms.items()}
+    n = np.bincount(codes, minlength=n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ss_tot = sums["y2"] - sums["y"] ** 2 / n
+        return {
+            "n": n,
+            "r2": np.where(ss_tot > 0, 1 - sums["error2"] / ss_tot, np.nan),
+            "rmse": np.sqrt(sums["error2"] / n),
+            "mae": sums["abs_error"] / n,
+            "rmsle": np.sqrt(sums["log_error2"] / n),
+            "mape": np.where(sums["nonzero"] > 0, 100 * sums["ape"] / sums["nonzero"], np.nan)
+        }
+
+
+def grouped_metrics(y_true, y_pred, codes, n_groups):
+    """
+    Computes regression metrics for every group in one vectorized pass.
+
+    Every metric is derived from per-group sums accumulated with `np.bincount`,
+    so the cost is a handful of linear passes over the rows whatever the number
+    of groups.
+
+    Parameters:
+    ----------
+    y_true : numpy.ndarray
+        Observed values.
+    y_pred : numpy.ndarray
+        Predicted values.
+    codes : numpy.ndarray of int
+        Group of every row, in `range(n_groups)`.
+    n_groups : int
+        Number of groups.
+
+    Returns:
+    -------
+    dict of str to numpy.ndarray
+        The row count `n` and every metric of `METRICS`, one value per group.
+        RMSLE clips negative predictions to 0 and MAPE (in %) only uses the rows
+        with a non-zero observed value. Metrics that are undefined for a group
+        (e.g. R² of a constant target) are NaN.
+    """
+    return _aggregate(_row_terms(y_true, y_pred), codes, n_groups)
+
+
+def _group_codes(groups):
+    # Factorize every grouping variable once, so several models can share the codes
+    if groups is None:
+        return []
+    group_codes = []
+    for column in groups.columns:
+        codes, levels = pd.factorize(groups[column], sort=True)
+        if (codes < 0).any():
+            raise ValueError(f"Missing values in group column '{column}'.")
+        group_codes.append((column, codes, np.asarray(levels).astype(str)))
+    return group_codes
+
+
+def _metrics_frame(y_true, y_pred, group_codes):
+    # The per-row terms are shared by the overall metrics and every breakdown
+    terms = _row_terms(y_true, y_pred)
+    overall = _aggregate(terms, np.zeros(len(terms["y"]), dtype=np.intp), 1)
+    tables = [pd.DataFrame({"group": "all", "level": "all", **overall})]
+    for column, codes, levels in group_codes:
+        tables.append(pd.DataFrame({"group": column, "level": levels, **_aggregate(terms, codes, len(levels))}))
+    return pd.concat(tables, ignore_index=True)
+
+
+def compute_metrics(y_true, y_pred, groups=None):
+    """
+    Computes the overall regression metrics and their breakdown by group.
+
+    Parameters:
+    ----------
+    y_true : array-like
+        Observed values.
+    y_pred : array-like
+        Predicted values.
+    groups : pd.DataFrame, optional
+        One column per grouping variable (e.g. the `GROUP_COLUMNS` of the test
+        data), aligned with `y_true`. Default is None (overall metrics only).
+
+    Returns:
+    -------
+    pd.DataFrame
+        One row per group level with the columns 'group', 'level', 'n' and the
+        `METRICS`. The overall metrics have group and level 'all'.
+
+    Raises:
+    ------
+    ValueError
+        If a grouping variable has missing values.
+    """
+    return _metrics_frame(y_true, y_pred, _group_codes(groups))
+
+
+def metrics_table(y_true, predictions, groups=None):
+    """
+    Computes the metrics of several models into one tidy table.
+
+    Parameters:
+    ----------
+    y_true : array-like
+        Observed values.
+    predictions : dict of str to numpy.ndarray
+        Predicted values keyed by model name.
+    groups : pd.DataFrame, optional
+        Grouping variables aligned with `y_true`. Default is None.
+
+    Returns:
+    -------
+    pd.DataFrame
+        One row per model and group level with the columns 'model', 'group',
+        'level', 'n' and the `METRICS`.
+    """
+    group_codes = _group_codes(groups)
+    tables = [
+        _metrics_frame(y_true, y_pred, group_codes).assign(model=name)
+        for name, y_pred in predictions.items()
+    ]
+    table = pd.concat(tables, ignore_index=True)
+    return table[["model", "group", "level", "n"] + METRICS]
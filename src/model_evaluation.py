@@ -2,46 +2,107 @@ import os
 import numpy as np
 import pandas as pd
 import pickle
-from sklearn import set_config
-from sklearn.metrics import PredictionErrorDisplay
+import joblib
+from concurrent.futures import ThreadPoolExecutor
+from sklearn import set_config, get_config, config_context
+from sklearn.metrics import PredictionErrorDisplay, r2_score
+from src.processed_data import read_processed
+from src.metrics import GROUP_COLUMNS, metrics_table
 
 
-def load_data(file_path: str):
+def load_data(file_path: str, columns=None):
     """
-    Load the test data from a CSV file.
+    Load the test data from a CSV or Parquet file.
 
     Parameters:
     ----------
     file_path : str
-        Path to the test data CSV file.
+        Path to the test data CSV or Parquet file.
+    columns : list of str, optional
+        Only load these columns. Default is None (all columns).
 
     Returns:
     -------
     pd.DataFrame 
         Loaded test data.
     """
-    return pd.read_csv(file_path)
+    return read_processed(file_path, columns=columns)
 
 
 def load_pipeline(pipeline_path):
     """
-    Load a machine learning pipeline object from a pickle file.
+    Load a machine learning pipeline object from a pickle or joblib file.
+
+    `.joblib` files (see `src.model_export.export_best_estimator`) are loaded
+    with their numpy arrays memory-mapped read-only.
 
     Parameters:
     ----------
     pipeline_path : str 
-        Path to the pipeline pickle file.
+        Path to the pipeline pickle or joblib file.
 
     Returns:
     -------
     object
         Loaded pipeline object.
     """
+    if str(pipeline_path).endswith(".joblib"):
+        return joblib.load(pipeline_path, mmap_mode="r")
     with open(pipeline_path, "rb") as f:
         return pickle.load(f)
 
 
-def evaluate_model(model, X, y):
+def predict_model(model, X):
+    """
+    Predict the target once, so the prediction vector can be reused by every metric and plot.
+
+    Parameters:
+    ----------
+    model : sklearn model
+        Trained model or pipeline.
+    X : pd.DataFrame
+        Feature set.
+
+    Returns:
+    -------
+    numpy.ndarray
+        Predicted values.
+    """
+    return np.asarray(model.predict(X))
+
+
+def predict_models(models, X):
+    """
+    Predict the target with several models concurrently.
+
+    Each model runs in its own thread; the heavy parts of scikit-learn's
+    predict (numpy operations and tree traversal) release the GIL.
+
+    Parameters:
+    ----------
+    models : dict of str to sklearn model
+        Trained models or pipelines keyed by name.
+    X : pd.DataFrame
+        Feature set.
+
+    Returns:
+    -------
+    dict of str to numpy.ndarray
+        Predicted values keyed by model name.
+    """
+    # sklearn's global config is thread-local, so hand it over to each thread
+    config = get_config()
+
+    def _predict(model):
+        with config_context(**config):
+            return predict_model(model, X)
+
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        predictions = executor.map(_predict, models.values())
+        return dict(zip(models.keys(), predictions))
+
+
+def evaluate_model(model, X, y, y_pred=None):
     """
     Evaluate a model's performance on test data.
 
@@ -53,13 +114,17 @@ def evaluate_model(model, X, y):
         Feature set.
     y : pd.Series 
         Target variable.
+    y_pred : numpy.ndarray, optional
+        Predictions of `model` on `X`. If given, the model is not run again.
 
     Returns:
     -------
     float
-        Model accuracy score.
+        Model accuracy score (R², as returned by a regressor's `score`).
     """
-    return model.score(X, y)
+    if y_pred is None:
+        y_pred = predict_model(model, X)
+    return r2_score(y, y_pred)
 
 
 def save_results(accuracy_ridge: float, accuracy_tree: float, output_path: str):
@@ -85,7 +150,7 @@ def save_results(accuracy_ridge: float, accuracy_tree: float, output_path: str):
     results.to_csv(output_path, index=False)
 
 
-def generate_prediction_plot(model, X, y, output_path):
+def generate_prediction_plot(model, X, y, output_path, y_pred=None):
     """
     Generate a scatter plot for actual vs predicted values.
 
@@ -99,15 +164,18 @@ def generate_prediction_plot(model, X, y, output_path):
         Target variable.
     output_path : str  
         Path to save the prediction plot.
+    y_pred : numpy.ndarray, optional
+        Predictions of `model` on `X`. If given, the model is not run again.
 
     Returns:
     -------
     None
     """
-    plot = PredictionErrorDisplay.from_estimator(
-        model,
-        X,
+    if y_pred is None:
+        y_pred = predict_model(model, X)
+    plot = PredictionErrorDisplay.from_predictions(
         y,
+        y_pred,
         kind="actual_vs_predicted",
         scatter_kwargs={"alpha": 0.12, "s": 10},
     )
@@ -122,13 +190,14 @@ def main_logic(test_data_path: str, pipeline_ridge_path: str, pipeline_tree_path
     Parameters:
     ----------
     test_data_path : str 
-        Path to the test data CSV file.
+        Path to the test data CSV or Parquet file.
     pipeline_ridge_path : str  
         Path to the Ridge Regression pipeline.
     pipeline_tree_path : str  
         Path to the Tree-based model pipeline.
     results_to : str  
-        Path to save the results CSV file.
+        Path to the directory where the results CSV files (test_scores.csv and
+        test_metrics.csv) are saved.
     plot_to : str  
         Path to save the plots.
     seed : int
@@ -150,17 +219,27 @@ def main_logic(test_data_path: str, pipeline_ridge_path: str, pipeline_tree_path
     X_test = test_data.drop("Rented Bike Count", axis=1)
     y_test = test_data["Rented Bike Count"]
 
+    # Predict once per model (both models concurrently) and reuse the predictions
+    predictions = predict_models({"ridge": ridge_model, "tree": tree_model}, X_test)
+
     # Evaluate models
-    accuracy_ridge = evaluate_model(ridge_model, X_test, y_test)
-    accuracy_tree = evaluate_model(tree_model, X_test, y_test)
+    accuracy_ridge = evaluate_model(ridge_model, X_test, y_test, y_pred=predictions["ridge"])
+    accuracy_tree = evaluate_model(tree_model, X_test, y_test, y_pred=predictions["tree"])
 
     # Save results
     save_results(accuracy_ridge, accuracy_tree, os.path.join(results_to, "test_scores.csv"))
 
+    # Overall and per-group RMSE, MAE, RMSLE, MAPE and R² from the same predictions
+    group_columns = [column for column in GROUP_COLUMNS if column in test_data.columns]
+    metrics = metrics_table(y_test, predictions, test_data[group_columns] if group_columns else None)
+    metrics.to_csv(os.path.join(results_to, "test_metrics.csv"), index=False)
+
     # Generate prediction plots
     generate_prediction_plot(
-        ridge_model, X_test, y_test, os.path.join(plot_to, "prediction_error_ridge.png")
+        ridge_model, X_test, y_test, os.path.join(plot_to, "prediction_error_ridge.png"),
+        y_pred=predictions["ridge"]
     )
     generate_prediction_plot(
-        tree_model, X_test, y_test, os.path.join(plot_to, "prediction_error_tree.png")
-    )
\ No newline at end of file
+        tree_model, X_test, y_test, os.path.join(plot_to, "prediction_error_tree.png"),
+        y_pred=predictions["tree"]
+    )
@@ -0,0 +1,87 @@
+import json
+import os
+import joblib
+import numpy as np
+
+
+def _to_builtin(value):
+    # numpy scalars (e.g. the sampled Ridge alpha) are not JSON serializable
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def search_metadata(search):
+    """
+    Extracts the search results worth keeping next to the exported model.
+
+    Parameters:
+    ----------
+    search : sklearn search object
+        A fitted hyperparameter search (e.g. RandomizedSearchCV).
+
+    Returns:
+    -------
+    dict
+        The best parameters, best cross-validation score, number of candidates and
+        folds, refit time and the estimator class of the final pipeline step.
+    """
+    return {
+        "estimator": type(search.best_estimator_[-1]).__name__,
+        "best_params": {name: _to_builtin(value) for name, value in search.best_params_.items()},
+        "best_score": float(search.best_score_),
+        "n_candidates": len(search.cv_results_["params"]),
+        "n_splits": int(search.n_splits_),
+        "refit_time": float(search.refit_time_)
+    }
+
+
+def export_best_estimator(search, model_to, name):
+    """
+    Saves only the refit best pipeline of a search, with the search metadata in a JSON sidecar.
+
+    The pipeline is written uncompressed with joblib, which stores numpy arrays
+    (e.g. Ridge coefficients and scaler statistics) as raw buffers that
+    `joblib.load(..., mmap_mode="r")` maps read-only, so several evaluation or
+    serving processes share the same pages. Decision tree node arrays are still
+    copied into the tree when it is loaded, since scikit-learn's `Tree` owns its
+    nodes. `cv_results_` and the unfitted search machinery are left out.
+
+    Parameters:
+    ----------
+    search : sklearn search object
+        A fitted hyperparameter search (e.g. RandomizedSearchCV).
+    model_to : str
+        Directory where the files are written.
+    name : str
+        Model name used in the file names, e.g. 'ridge'.
+
+    Returns:
+    -------
+    tuple of (str, str)
+        Paths to `<name>_model.joblib` and `<name>_search.json`.
+    """
+    model_path = os.path.join(model_to, f"{name}_model.joblib")
+    metadata_path = os.path.join(model_to, f"{name}_search.json")
+    joblib.dump(search.best_estimator_, model_path)
+    with open(metadata_path, "w") as f:
+        json.dump(search_metadata(search), f, indent=2)
+    return model_path, metadata_path
+
+
+def load_search_metadata(metadata_path):
+    """
+    Loads the search metadata saved by `export_best_estimator`.
+
+    Parameters:
+    ----------
+    metadata_path : str
+        Path to a `<name>_search.json` file.
+
+    Returns:
+    -------
+    dict
+        The search metadata.
+    """
+    with open(metadata_path) as f:
+        return json.load(f)
@@ -0,0 +1,101 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from sklearn import set_config
+from src.processed_data import iter_processed
+from src.model_evaluation import load_pipeline
+
+TARGET = "Rented Bike Count"
+PREDICTION = "Predicted Rented Bike Count"
+
+# Pipeline loaded once in each worker process
+_worker_pipeline = None
+
+
+def _init_worker(pipeline_path):
+    global _worker_pipeline
+    set_config(transform_output="pandas")
+    _worker_pipeline = load_pipeline(pipeline_path)
+
+
+def _predict_chunk(chunk):
+    return _worker_pipeline.predict(chunk.drop(columns=TARGET, errors="ignore"))
+
+
+def _write_predictions(predictions, output_path, header):
+    pd.DataFrame({PREDICTION: predictions}).to_csv(
+        output_path, mode="w" if header else "a", header=header, index=False
+    )
+
+
+def predict_in_chunks(pipeline_path, input_path, output_path, chunksize=100_000, n_jobs=None):
+    """
+    Scores a feature file of any size with a fitted pipeline, chunk by chunk.
+
+    The features are read `chunksize` rows at a time and the predictions of
+    each chunk are appended to the output CSV as soon as they are ready, in
+    the same order as the input rows. With `n_jobs` > 1 the chunks are spread
+    over worker processes that each load the pipeline once. At most two chunks
+    per worker are in flight, so memory stays bounded whatever the file size.
+
+    Parameters:
+    ----------
+    pipeline_path : str
+        Path to the fitted pipeline pickle (e.g. ridge_pipeline.pickle).
+    input_path : str
+        Path to the processed features, as CSV or Parquet. A 'Rented Bike Count'
+        column, if present, is ignored.
+    output_path : str
+        Path of the CSV file the predictions are written to.
+    chunksize : int, optional
+        Number of rows scored at a time. Default is 100,000.
+    n_jobs : int, optional
+        Number of worker processes. Default is None, which scores in this process.
+
+    Returns:
+    -------
+    dict
+        The number of rows and chunks scored, the elapsed seconds and the
+        throughput in rows per second.
+    """
+    start = time.perf_counter()
+    n_rows = n_chunks = 0
+    chunks = iter_processed(input_path, chunksize)
+
+    if n_jobs is None or n_jobs == 1:
+        _init_worker(pipeline_path)
+        for chunk in chunks:
+            _write_predictions(_predict_chunk(chunk), output_path, header=n_chunks == 0)
+            n_rows += len(chunk)
+            n_chunks += 1
+    else:
+        n_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(pipeline_path,)) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((len(chunk), executor.submit(_predict_chunk, chunk)))
+                # write finished chunks in order once the window is full
+                while len(pending) >= 2 * n_workers:
+                    size, future = pending.popleft()
+                    _write_predictions(future.result(), output_path, header=n_chunks == 0)
+                    n_rows += size
+                    n_chunks += 1
+            while pending:
+                size, future = pending.popleft()
+                _write_predictions(future.result(), output_path, header=n_chunks == 0)
+                n_rows += size
+                n_chunks += 1
+
+    if n_chunks == 0:
+        _write_predictions([], output_path, header=True)
+
+    seconds = time.perf_counter() - start
+    return {
+        "rows": n_rows,
+        "chunks": n_chunks,
+        "seconds": seconds,
+        "rows_per_sec": n_rows / seconds if seconds > 0 else float("inf")
+    }
@@ -0,0 +1,115 @@
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# Explicit column types of the processed train/test splits
+PROCESSED_SCHEMA = pa.schema([
+    ("Rented Bike Count", pa.int64()),
+    ("Hour", pa.int64()),
+    ("Temperature", pa.float64()),
+    ("Humidity", pa.int64()),
+    ("Wind speed", pa.float64()),
+    ("Visibility", pa.int64()),
+    ("Dew point temperature", pa.float64()),
+    ("Radiation", pa.float64()),
+    ("Rainfall", pa.float64()),
+    ("Snowfall", pa.float64()),
+    ("Seasons", pa.dictionary(pa.int8(), pa.string())),
+    ("Holiday", pa.int64()),
+    ("Functioning Day", pa.int64()),
+    ("Year", pa.int64()),
+    ("Month", pa.int64()),
+    ("Day", pa.int64()),
+    ("Weekday", pa.int64())
+])
+
+DATA_FORMATS = {"csv": ".csv", "parquet": ".parquet"}
+
+
+def is_parquet(file_path):
+    """
+    Checks whether a processed data file is stored as Parquet, based on its extension.
+
+    Parameters:
+    ----------
+    file_path : str
+        Path to the processed data file.
+
+    Returns:
+    -------
+    bool
+        True for a `.parquet` file, False otherwise (CSV).
+    """
+    return os.path.splitext(str(file_path))[1].lower() == ".parquet"
+
+
+def write_processed(df, file_path):
+    """
+    Writes a processed data split as CSV or Parquet depending on the file extension.
+
+    Parquet files are written with the explicit `PROCESSED_SCHEMA`, so the column
+    types are fixed once at write time instead of being re-inferred on every read.
+
+    Parameters:
+    ----------
+    df : pd.DataFrame
+        The processed data split.
+    file_path : str
+        Destination path ending in `.csv` or `.parquet`.
+
+    Returns:
+    -------
+    None
+    """
+    if is_parquet(file_path):
+        table = pa.Table.from_pandas(df, schema=PROCESSED_SCHEMA, preserve_index=False)
+        pq.write_table(table, file_path)
+    else:
+        df.to_csv(file_path, index=False)
+
+
+def read_processed(file_path, columns=None):
+    """
+    Reads a processed data split stored as CSV or Parquet.
+
+    Parameters:
+    ----------
+    file_path : str
+        Path to a `.csv` or `.parquet` file.
+    columns : list of str, optional
+        Only read these columns. Default is None (all columns).
+
+    Returns:
+    -------
+    pd.DataFrame
+        The processed data split.
+    """
+    if is_parquet(file_path):
+        return pd.read_parquet(file_path, columns=columns)
+    return pd.read_csv(file_path, usecols=columns)
+
+
+def iter_processed(file_path, chunksize, columns=None):
+    """
+    Reads a processed data file stored as CSV or Parquet in chunks of rows.
+
+    Parameters:
+    ----------
+    file_path : str
+        Path to a `.csv` or `.parquet` file.
+    chunksize : int
+        Number of rows per chunk.
+    columns : list of str, optional
+        Only read these columns. Default is None (all columns).
+
+    Returns:
+    -------
+    iterator of pd.DataFrame
+        The chunks, in file order.
+    """
+    if is_parquet(file_path):
+        parquet_file = pq.ParquetFile(file_path)
+        return (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns))
+    return pd.read_csv(file_path, usecols=columns, chunksize=chunksize)
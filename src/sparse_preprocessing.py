@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.preprocessing import OneHotEncoder
+
+
+def make_sparse_preprocessor(preprocessor):
+    """
+    Creates an unfitted copy of a column transformer that outputs a scipy CSR matrix.
+
+    Every OneHotEncoder in the transformer is switched to sparse output and the
+    output of the whole transformer is forced to be sparse. The pandas output set
+    with `set_config(transform_output="pandas")` is turned off for this copy only,
+    since pandas output does not support sparse data. The original preprocessor
+    is left untouched so the dense path stays available for models that need it.
+
+    Parameters:
+    ----------
+    preprocessor : sklearn.compose.ColumnTransformer
+        The preprocessor used by the dense pipelines (e.g. bike_preprocessor.pickle).
+
+    Returns:
+    -------
+    sklearn.compose.ColumnTransformer
+        An unfitted preprocessor producing CSR output.
+    """
+    sparse_preprocessor = clone(preprocessor)
+    for name, transformer, _ in sparse_preprocessor.transformers:
+        if isinstance(transformer, OneHotEncoder):
+            sparse_preprocessor.set_params(**{f"{name}__sparse_output": True})
+    sparse_preprocessor.set_params(sparse_threshold=1.0)
+    sparse_preprocessor.set_output(transform="default")
+    return sparse_preprocessor
+
+
+def matrix_nbytes(matrix):
+    """
+    Computes the memory used by a preprocessed feature matrix.
+
+    Parameters:
+    ----------
+    matrix : scipy.sparse matrix, numpy.ndarray or pd.DataFrame
+        The preprocessed feature matrix.
+
+    Returns:
+    -------
+    int
+        Number of bytes used by the matrix.
+    """
+    if sparse.issparse(matrix):
+        matrix = matrix.tocsr()
+        return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    if isinstance(matrix, pd.DataFrame):
+        return int(matrix.memory_usage(index=False, deep=True).sum())
+    return np.asarray(matrix).nbytes
+
+
+def sparse_memory_report(sparse_matrix):
+    """
+    Compares the memory of a CSR feature matrix with its dense float64 equivalent.
+
+    The dense size is computed from the shape, so the dense matrix is never built.
+
+    Parameters:
+    ----------
+    sparse_matrix : scipy.sparse matrix
+        The preprocessed feature matrix produced by the sparse preprocessor.
+
+    Returns:
+    -------
+    dict
+        The dense and sparse sizes in bytes, the bytes saved and the matrix density.
+    """
+    n_rows, n_cols = sparse_matrix.shape
+    dense_bytes = n_rows * n_cols * np.dtype(np.float64).itemsize
+    sparse_bytes = matrix_nbytes(sparse_matrix)
+    return {
+        "dense_bytes": dense_bytes,
+        "sparse_bytes": sparse_bytes,
+        "saved_bytes": dense_bytes - sparse_bytes,
+        "density": sparse_matrix.nnz / (n_rows * n_cols) if n_rows * n_cols else 0.0
+    }
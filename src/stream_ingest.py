@@ -0,0 +1,177 @@
+import os
+import shutil
+import tempfile
+import zipfile
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+import numpy as np
+import pandas as pd
+import requests
+from src.data_validation import CHUNK_SCHEMA, validate_in_chunks
+
+# Float columns are read as floats explicitly, otherwise a chunk that only
+# holds whole numbers would be inferred as integers and fail the schema
+FLOAT_COLUMNS = [name for name, column in CHUNK_SCHEMA.columns.items() if str(column.dtype) == "float64"]
+
+
+def spool_download(url, file_path, chunk_size=1 << 20):
+    """
+    Downloads a file to disk in chunks, so it is never held in memory as a whole.
+
+    Parameters:
+    ----------
+    url : str
+        URL of the file. `http(s)://` URLs are streamed with requests and
+        `file://` URLs are copied from the local file system.
+    file_path : str
+        Destination path of the downloaded file.
+    chunk_size : int, optional
+        Number of bytes read and written at a time. Default is 1 MiB.
+
+    Returns:
+    -------
+    str
+        The destination path.
+    """
+    parsed_url = urlparse(url)
+    if parsed_url.scheme == "file":
+        with open(url2pathname(parsed_url.path), "rb") as source, open(file_path, "wb") as target:
+            shutil.copyfileobj(source, target, chunk_size)
+        return file_path
+
+    with requests.get(url, stream=True) as response:
+        response.raise_for_status()
+        with open(file_path, "wb") as target:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                target.write(chunk)
+    return file_path
+
+
+def read_zip_streaming(url, directory, chunk_size=1 << 20):
+    """
+    Downloads a ZIP archive to disk in chunks and extracts it into `directory`.
+
+    Parameters:
+    ----------
+    url : str
+        URL of the ZIP archive (`http(s)://` or `file://`).
+    directory : str
+        Directory the archive is extracted to.
+    chunk_size : int, optional
+        Number of bytes downloaded at a time. Default is 1 MiB.
+
+    Returns:
+    -------
+    str
+        Path to the first CSV file of the archive.
+
+    Raises:
+    ------
+    ValueError
+        If the URL does not point to a ZIP archive or the archive has no CSV file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    handle, archive_path = tempfile.mkstemp(suffix=".zip", dir=directory)
+    os.close(handle)
+    try:
+        spool_download(url, archive_path, chunk_size)
+        if not zipfile.is_zipfile(archive_path):
+            raise ValueError("❌ The URL does not point to a valid ZIP file.")
+
+        with zipfile.ZipFile(archive_path) as z:
+            file_list = z.namelist()
+            csv_files = [f for f in file_list if f.endswith(".csv")]
+            if not csv_files:
+                raise ValueError("❌ No CSV files found in the ZIP archive.")
+            # extractall copies each member to disk in blocks
+            z.extractall(directory)
+    finally:
+        os.remove(archive_path)
+
+    print(f"Data validation 1-2 ✅ Extracted files and csv format ✅ : {file_list}")
+    return os.path.join(directory, csv_files[0])
+
+
+def validate_csv_in_chunks(file_path, chunksize=100_000, max_null_fraction=0.05,
+                           sample_size=10_000, seed=123, encoding="ISO-8859-1"):
+    """
+    Validates a raw bike CSV file chunk by chunk with bounded memory.
+
+    Each chunk is checked with `src.data_validation.validate_in_chunks` as soon
+    as it is read. The checks spanning the whole file are kept as running
+    aggregates: the null count of every column and the number of completely
+    empty and duplicated rows. A uniform random sample of the rows is kept for
+    checks that need the data itself (e.g. skewness).
+
+    Parameters:
+    ----------
+    file_path : str
+        Path to the raw CSV file.
+    chunksize : int, optional
+        Number of rows read at a time. Default is 100,000.
+    max_null_fraction : float, optional
+        Maximum fraction of missing values allowed in 'Rainfall(mm)'. Default is 0.05.
+    sample_size : int, optional
+        Number of rows kept in the returned sample. Default is 10,000.
+    seed : int, optional
+        Random seed used to draw the sample. Default is 123.
+    encoding : str, optional
+        Encoding of the CSV file. Default is 'ISO-8859-1'.
+
+    Returns:
+    -------
+    tuple of (pd.DataFrame, dict)
+        A uniform random sample of at most `sample_size` rows, and a summary with
+        the number of rows and chunks, the duplicated and empty row counts and
+        the null fraction of every column.
+
+    Raises:
+    ------
+    pandera.errors.SchemaErrors
+        If a chunk does not conform to `CHUNK_SCHEMA`.
+    ValueError
+        If the file has no rows, duplicated or empty rows, or too many missing
+        values in 'Rainfall(mm)'.
+    """
+    rng = np.random.default_rng(seed)
+    n_rows = n_chunks = duplicate_rows = empty_rows = 0
+    null_counts = None
+    sample = None
+
+    reader = pd.read_csv(file_path, encoding=encoding, chunksize=chunksize,
+                         dtype={column: float for column in FLOAT_COLUMNS})
+    for chunk, report in validate_in_chunks(reader):
+        if report["error"] is not None:
+            raise report["error"]
+
+        n_rows += report["n_rows"]
+        n_chunks += 1
+        duplicate_rows += report["duplicate_rows"]
+        empty_rows += report["empty_rows"]
+        null_counts = report["null_counts"] if null_counts is None else null_counts + report["null_counts"]
+
+        # Bottom-k sampling on random keys gives a uniform sample of the whole file
+        chunk = chunk.assign(_sample_key=rng.random(len(chunk)))
+        sample = chunk if sample is None else pd.concat([sample, chunk])
+        sample = sample.nsmallest(sample_size, "_sample_key")
+
+    if n_rows == 0:
+        raise ValueError("❌ The CSV file must contain observations.")
+
+    null_fraction = null_counts / n_rows
+    summary = {
+        "n_rows": n_rows,
+        "n_chunks": n_chunks,
+        "duplicate_rows": duplicate_rows,
+        "empty_rows": empty_rows,
+        "null_fraction": null_fraction
+    }
+    if duplicate_rows:
+        raise ValueError(f"❌ Duplicate rows found: {duplicate_rows}.")
+    if empty_rows:
+        raise ValueError(f"❌ Empty rows found: {empty_rows}.")
+    if null_fraction.get("Rainfall(mm)", 0) > max_null_fraction:
+        raise ValueError("❌ Too many null values in 'Rainfall(mm)' column.")
+
+    sample = sample.drop(columns="_sample_key").sort_index()
+    return sample, summary
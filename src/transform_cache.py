@@ -0,0 +1,133 @@
+import hashlib
+import os
+import joblib
+import pandas as pd
+
+
+def _fingerprint(obj):
+    """
+    Returns a hash of `obj`, using pandas' vectorized row hashing for data frames and series.
+
+    Parameters:
+    ----------
+    obj : object
+        Any picklable object.
+
+    Returns:
+    -------
+    str
+        Hex digest identifying `obj`.
+    """
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        digest = hashlib.sha1(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        digest.update(joblib.hash(obj.dtypes.astype(str).tolist() if isinstance(obj, pd.DataFrame)
+                                  else [str(obj.dtype), obj.name]).encode())
+        if isinstance(obj, pd.DataFrame):
+            digest.update(joblib.hash(list(obj.columns)).encode())
+        return digest.hexdigest()
+    return joblib.hash(obj)
+
+
+class TransformCache:
+    """
+    A joblib.Memory-like cache for the fitted transformers of a pipeline.
+
+    Passed as the `memory` argument of a scikit-learn Pipeline, the fitted
+    preprocessor and its transformed matrix are keyed on a hash of the
+    transformer parameters and the fold data. During a hyperparameter search
+    every candidate of every pipeline sharing the same preprocessor sees the
+    same fold, so each fold is only preprocessed once and the result is reused.
+
+    Results are kept in memory and, when `cache_dir` is given, also written to
+    disk with joblib. The in-memory store is not pickled, so parallel worker
+    processes only share results through `cache_dir`.
+
+    Parameters:
+    ----------
+    cache_dir : str, optional
+        Directory used to persist the cached transforms. Default is None,
+        which keeps the cache in memory only.
+
+    Attributes:
+    ----------
+    hits : int
+        Number of calls answered from the cache.
+    misses : int
+        Number of calls that had to fit the transformer.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._store = {}
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def cache(self, func):
+        """
+        Wraps `func` so its results are looked up in the cache before being computed.
+
+        Parameters:
+        ----------
+        func : callable
+            Function to cache, e.g. the pipeline's `_fit_transform_one`.
+
+        Returns:
+        -------
+        callable
+            The cached version of `func`.
+        """
+        def cached_func(*args, **kwargs):
+            key = joblib.hash((
+                func.__module__,
+                func.__qualname__,
+                [_fingerprint(arg) for arg in args],
+                {name: _fingerprint(value) for name, value in kwargs.items()}
+            ))
+            if key not in self._store:
+                self._store[key] = self._load_or_compute(key, func, args, kwargs)
+            else:
+                self.hits += 1
+            return self._store[key]
+
+        return cached_func
+
+    def _load_or_compute(self, key, func, args, kwargs):
+        path = os.path.join(self.cache_dir, f"{key}.joblib") if self.cache_dir else None
+        if path is not None and os.path.exists(path):
+            self.hits += 1
+            return joblib.load(path)
+
+        self.misses += 1
+        result = func(*args, **kwargs)
+        if path is not None:
+            # write to a temporary file first so concurrent workers never read a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            joblib.dump(result, tmp_path)
+            os.replace(tmp_path, path)
+        return result
+
+    def clear(self):
+        """
+        Empties the in-memory store and removes the cached files in `cache_dir`, if any.
+
+        Returns:
+        -------
+        None
+        """
+        self._store.clear()
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for file in os.listdir(self.cache_dir):
+                if file.endswith(".joblib"):
+                    os.remove(os.path.join(self.cache_dir, file))
+
+    def __deepcopy__(self, memo):
+        # clone() deep-copies non-estimator parameters for every search
+        # candidate; they must all share this cache to get any reuse
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_store"] = {}
+        return state
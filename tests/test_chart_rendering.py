@@ -0,0 +1,56 @@
+# tests/test_chart_rendering.py
+import pytest
+import os
+import sys
+import altair as alt
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.chart_rendering import MANIFEST_NAME, render_charts, spec_hash
+
+def make_charts(df):
+    return {
+        "hourly": alt.Chart(df).mark_line().encode(x="Hour:O", y="mean(Rented Bike Count):Q"),
+        "scatter": alt.Chart(df).mark_circle().encode(x="Hour:Q", y="Rented Bike Count:Q"),
+    }
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"Hour": [0, 1, 2, 3], "Rented Bike Count": [10, 20, 15, 30]})
+
+def test_render_charts_writes_pngs(tmp_path, df):
+    result = render_charts(make_charts(df), tmp_path, prefix="test_")
+    assert sorted(result["rendered"]) == ["test_hourly.png", "test_scatter.png"]
+    for file_name in result["rendered"]:
+        with open(tmp_path / file_name, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+    assert (tmp_path / MANIFEST_NAME).is_file()
+
+def test_unchanged_charts_are_skipped(tmp_path, df):
+    render_charts(make_charts(df), tmp_path)
+    result = render_charts(make_charts(df), tmp_path)
+    assert result["rendered"] == []
+    assert sorted(result["skipped"]) == ["hourly.png", "scatter.png"]
+
+def test_changed_data_or_missing_file_is_rerendered(tmp_path, df):
+    render_charts(make_charts(df), tmp_path)
+    os.remove(tmp_path / "scatter.png")
+    result = render_charts(make_charts(df), tmp_path)
+    assert result["rendered"] == ["scatter.png"]
+
+    changed = df.assign(**{"Rented Bike Count": [11, 20, 15, 30]})
+    result = render_charts(make_charts(changed), tmp_path)
+    assert sorted(result["rendered"]) == ["hourly.png", "scatter.png"]
+
+def test_parallel_rendering_matches_serial(tmp_path, df):
+    serial_dir, parallel_dir = tmp_path / "serial", tmp_path / "parallel"
+    serial_dir.mkdir()
+    parallel_dir.mkdir()
+    render_charts(make_charts(df), serial_dir)
+    render_charts(make_charts(df), parallel_dir, n_jobs=2)
+    for file_name in ["hourly.png", "scatter.png"]:
+        assert (serial_dir / file_name).read_bytes() == (parallel_dir / file_name).read_bytes()
+
+def test_spec_hash_depends_on_scale_factor(df):
+    spec = make_charts(df)["hourly"].to_dict()
+    assert spec_hash(spec, 2.0) == spec_hash(spec, 2.0)
+    assert spec_hash(spec, 2.0) != spec_hash(spec, 1.0)
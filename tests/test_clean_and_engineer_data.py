@@ -4,7 +4,12 @@ import pandas as pd
 import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from src.clean_and_engineer_data import clean_and_engineer_data
+from sklearn.base import clone
+from sklearn.pipeline import make_pipeline
+from sklearn.compose import make_column_transformer
+from sklearn.preprocessing import OneHotEncoder
+from sklearn.linear_model import Ridge
+from src.clean_and_engineer_data import clean_and_engineer_data, BikeFeatureEngineer
 
 @pytest.fixture
 def raw_data():
@@ -51,4 +56,40 @@ def test_binary_encoding(raw_data):
         assert processed_data['Functioning Day'].iloc[0] == 1, "Functioning Day binary encoding failed."
         assert processed_data['Functioning Day'].iloc[1] == 0, "Functioning Day binary encoding failed."
     except Exception as e:
-        pytest.fail(f"Test failed with error: {e}")
\ No newline at end of file
+        pytest.fail(f"Test failed with error: {e}")
+def test_day_first_date_parsing(raw_data):
+    # Seoul dates are day-first, e.g. 01/12/2017 is the 1st of December
+    raw_data['Date'] = ['01/12/2017', '13/05/2018']
+    processed_data = clean_and_engineer_data(raw_data)
+    assert processed_data['Month'].tolist() == [12, 5], "Dates should be parsed day-first."
+    assert processed_data['Day'].tolist() == [1, 13], "Dates should be parsed day-first."
+
+def test_mixed_date_fallback(raw_data):
+    raw_data['Date'] = ['01/12/2017', '2018-05-13']
+    processed_data = clean_and_engineer_data(raw_data)
+    assert processed_data['Year'].tolist() == [2017, 2018], "Non day-first dates should fall back to mixed parsing."
+    assert processed_data['Month'].tolist() == [12, 5], "Non day-first dates should fall back to mixed parsing."
+
+def test_seasons_categorical(raw_data):
+    processed_data = clean_and_engineer_data(raw_data)
+    assert isinstance(processed_data['Seasons'].dtype, pd.CategoricalDtype), "Seasons should be categorical."
+    assert processed_data['Seasons'].tolist() == ['Spring', 'Winter'], "Seasons values should be preserved."
+
+def test_input_not_modified(raw_data):
+    original = raw_data.copy()
+    clean_and_engineer_data(raw_data)
+    pd.testing.assert_frame_equal(raw_data, original)
+
+def test_feature_engineer_transformer(raw_data):
+    transformer = clone(BikeFeatureEngineer())
+    transformed = transformer.fit(raw_data).transform(raw_data)
+    pd.testing.assert_frame_equal(transformed, clean_and_engineer_data(raw_data))
+
+def test_feature_engineer_in_pipeline(raw_data):
+    pipeline = make_pipeline(
+        BikeFeatureEngineer(),
+        make_column_transformer((OneHotEncoder(), ['Seasons']), remainder='passthrough'),
+        Ridge()
+    )
+    pipeline.fit(raw_data, [100, 200])
+    assert len(pipeline.predict(raw_data)) == 2, "The pipeline should predict on raw records."
@@ -5,7 +5,7 @@ import pandas as pd
 import pandera as pa
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from src.data_validation import data_validation
+from src.data_validation import data_validation, validate_in_chunks, RowHashIndex
 
 # Test data setup
 valid_data = pd.DataFrame({
@@ -89,4 +89,39 @@ invalid_data_case.append((case_missing_obs, f"Check absent or incorrect for miss
 @pytest.mark.parametrize("invalid_data, description", invalid_data_case)
 def test_valid_w_invalid_data(invalid_data, description):
     with pytest.raises(pa.errors.SchemaErrors) as exc_info:
-        data_validation(invalid_data)
\ No newline at end of file
+        data_validation(invalid_data)
+
+# Chunked validation
+valid_chunk_data = valid_data.astype({"Temperature(°C)": float, "Dew point temperature(°C)": float})
+
+def test_validate_in_chunks_valid_data():
+    chunks = [valid_chunk_data.iloc[:2], valid_chunk_data.iloc[2:]]
+    results = list(validate_in_chunks(chunks))
+    assert [report["n_rows"] for _, report in results] == [2, 1]
+    assert all(report["error"] is None for _, report in results)
+    assert all(report["failure_cases"].empty for _, report in results)
+    pd.testing.assert_frame_equal(pd.concat([chunk for chunk, _ in results]), valid_chunk_data)
+
+def test_validate_in_chunks_duplicates_across_chunks():
+    chunks = [valid_data, valid_data.iloc[[0, 0]]]
+    results = list(validate_in_chunks(chunks))
+    _, second_report = results[1]
+    assert second_report["duplicate_rows"] == 2, "Rows seen in an earlier chunk should be counted as duplicates"
+    assert results[1][0].empty, "Duplicated rows should be dropped from the chunk"
+
+def test_validate_in_chunks_reuses_hash_index():
+    hash_index = RowHashIndex()
+    list(validate_in_chunks([valid_data], hash_index=hash_index))
+    assert len(hash_index) == 3
+    _, report = next(validate_in_chunks([valid_data.iloc[[1]]], hash_index=hash_index))
+    assert report["duplicate_rows"] == 1, "Rows from earlier feeds should be recognized"
+
+def test_validate_in_chunks_reports_errors():
+    _, report = next(validate_in_chunks([case_out_of_upper]))
+    assert isinstance(report["error"], pa.errors.SchemaErrors)
+    assert not report["failure_cases"].empty, "Failure cases should be reported"
+
+def test_validate_in_chunks_empty_rows():
+    chunk, report = next(validate_in_chunks([case_missing_obs]))
+    assert report["empty_rows"] == 1
+    assert len(chunk) == 3, "Empty rows should be dropped from the chunk"
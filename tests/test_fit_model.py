@@ -81,4 +81,62 @@ def test_tree_pipeline_not_empty(setup_and_teardown):
             assert tree_pipeline is not None, "Decision tree pipeline is empty"
     
     except Exception as e:
-        pytest.fail(f"An error occurred while checking the decision tree pipeline: {e}")
\ No newline at end of file
+        pytest.fail(f"An error occurred while checking the decision tree pipeline: {e}")
+def test_parallel_search_matches_serial(tmp_path):
+    """
+    Test that the parallel search mode gives the same results as the serial run for the same seed.
+    """
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+    serial_dir.mkdir()
+    parallel_dir.mkdir()
+
+    fit_model(TEMP_TRAINING_DATA, PREPROCESSOR_PATH, serial_dir, seed=522)
+    fit_model(TEMP_TRAINING_DATA, PREPROCESSOR_PATH, parallel_dir, seed=522, n_jobs=2)
+
+    for name in ["ridge_pipeline.pickle", "tree_pipeline.pickle"]:
+        with open(serial_dir / name, 'rb') as f:
+            serial_search = pickle.load(f)
+        with open(parallel_dir / name, 'rb') as f:
+            parallel_search = pickle.load(f)
+        assert serial_search.best_params_ == parallel_search.best_params_, f"Best parameters differ for {name}"
+        assert serial_search.cv_results_["mean_test_score"].tolist() == \
+            parallel_search.cv_results_["mean_test_score"].tolist(), f"CV scores differ for {name}"
+
+def test_cached_search_matches_uncached(tmp_path):
+    """
+    Test that caching the per-fold preprocessing does not change the search results.
+    """
+    cached_dir = tmp_path / "cached"
+    uncached_dir = tmp_path / "uncached"
+    cached_dir.mkdir()
+    uncached_dir.mkdir()
+
+    fit_model(TEMP_TRAINING_DATA, PREPROCESSOR_PATH, cached_dir, seed=522, cache_dir=str(tmp_path / "cache"))
+    fit_model(TEMP_TRAINING_DATA, PREPROCESSOR_PATH, uncached_dir, seed=522, cache_transforms=False)
+
+    for name in ["ridge_pipeline.pickle", "tree_pipeline.pickle"]:
+        with open(cached_dir / name, 'rb') as f:
+            cached_search = pickle.load(f)
+        with open(uncached_dir / name, 'rb') as f:
+            uncached_search = pickle.load(f)
+        assert cached_search.best_params_ == uncached_search.best_params_, f"Best parameters differ for {name}"
+        assert cached_search.best_estimator_.memory is None, "The saved pipeline should not reference the cache"
+
+def test_sparse_ridge_pipeline(tmp_path):
+    """
+    Test that the sparse Ridge pipeline scores the same as the dense one.
+    """
+    sparse_dir = tmp_path / "sparse"
+    dense_dir = tmp_path / "dense"
+    sparse_dir.mkdir()
+    dense_dir.mkdir()
+
+    fit_model(TEMP_TRAINING_DATA, PREPROCESSOR_PATH, sparse_dir, seed=522, sparse=True)
+    fit_model(TEMP_TRAINING_DATA, PREPROCESSOR_PATH, dense_dir, seed=522)
+    with open(sparse_dir / "ridge_pipeline.pickle", 'rb') as f:
+        sparse_search = pickle.load(f)
+    with open(dense_dir / "ridge_pipeline.pickle", 'rb') as f:
+        dense_search = pickle.load(f)
+    assert sparse_search.best_estimator_[-1].solver == "sparse_cg", "Ridge should use a sparse-aware solver"
+    assert sparse_search.best_score_ == pytest.approx(dense_search.best_score_, rel=1e-3)
@@ -0,0 +1,83 @@
+# tests/test_inference_server.py
+import pytest
+import json
+import os
+import sys
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.clean_and_engineer_data import clean_and_engineer_data
+from src.inference_server import LatencyTracker, load_model, make_server
+
+RAW_DATA = "data/raw/SeoulBikeData.csv"
+PIPELINE_PATH = "results/models/ridge_pipeline.pickle"
+
+@pytest.fixture(scope="module")
+def raw_records():
+    raw = pd.read_csv(RAW_DATA, encoding="ISO-8859-1", nrows=48)
+    return raw.drop(columns="Rented Bike Count")
+
+@pytest.fixture(scope="module")
+def model():
+    return load_model(PIPELINE_PATH)
+
+@pytest.fixture(scope="module")
+def server_url(model):
+    server = make_server({"ridge": model}, port=0, max_wait_ms=20)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def post(url, body):
+    request = urllib.request.Request(url + "/predict", data=json.dumps(body).encode(),
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+def test_load_model_returns_best_estimator(model):
+    assert not hasattr(model, "best_estimator_")
+    assert hasattr(model, "predict")
+
+def test_predictions_match_offline_scoring(server_url, raw_records, model):
+    set_config(transform_output="pandas")
+    expected = model.predict(clean_and_engineer_data(raw_records.copy())[model.feature_names_in_])
+    response = post(server_url, {"records": raw_records.to_dict("records")})
+    np.testing.assert_allclose(response["predictions"]["ridge"], expected)
+
+def test_concurrent_requests_are_batched(server_url, raw_records, model):
+    set_config(transform_output="pandas")
+    expected = model.predict(clean_and_engineer_data(raw_records.copy())[model.feature_names_in_])
+    records = raw_records.to_dict("records")
+    with ThreadPoolExecutor(8) as executor:
+        responses = list(executor.map(lambda record: post(server_url, record), records))
+    predictions = [response["predictions"]["ridge"][0] for response in responses]
+    np.testing.assert_allclose(predictions, expected)
+
+    with urllib.request.urlopen(server_url + "/metrics") as response:
+        metrics = json.loads(response.read())
+    assert metrics["requests"] >= len(records)
+    assert metrics["batches"] < metrics["requests"]
+    assert metrics["p99_ms"] >= metrics["p50_ms"] > 0
+
+def test_missing_columns_are_rejected(server_url):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(server_url, {"Hour": 3})
+    assert error.value.code == 400
+    assert "Missing columns" in json.loads(error.value.read())["error"]
+
+def test_latency_tracker_percentiles():
+    tracker = LatencyTracker(window=100)
+    assert tracker.summary()["p50_ms"] is None
+    for seconds in np.arange(1, 101) / 1000:
+        tracker.record(seconds)
+    summary = tracker.summary()
+    assert summary["requests"] == 100
+    assert summary["p50_ms"] == pytest.approx(50.5)
+    assert summary["p99_ms"] == pytest.approx(99.01)
@@ -0,0 +1,79 @@
+# tests/test_metrics.py
+import pytest
+import os
+import sys
+import numpy as np
+import pandas as pd
+from sklearn.metrics import (
+    mean_absolute_error,
+    mean_squared_error,
+    mean_squared_log_error,
+    r2_score,
+)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.metrics import METRICS, compute_metrics, grouped_metrics, metrics_table
+
+@pytest.fixture
+def predictions():
+    rng = np.random.default_rng(522)
+    n = 500
+    groups = pd.DataFrame({
+        "Hour": rng.integers(0, 24, n),
+        "Seasons": rng.choice(["Winter", "Spring", "Summer", "Autumn"], n),
+    })
+    y_true = rng.integers(0, 2000, n)
+    y_true[:20] = 0
+    y_pred = np.clip(y_true + rng.normal(0, 150, n), 0, None)
+    return y_true, y_pred, groups
+
+def reference_metrics(y_true, y_pred):
+    nonzero = y_true != 0
+    return {
+        "r2": r2_score(y_true, y_pred),
+        "rmse": np.sqrt(mean_squared_error(y_true, y_pred)),
+        "mae": mean_absolute_error(y_true, y_pred),
+        "rmsle": np.sqrt(mean_squared_log_error(y_true, y_pred)),
+        "mape": 100 * np.mean(np.abs(y_pred[nonzero] - y_true[nonzero]) / y_true[nonzero]),
+    }
+
+def test_overall_metrics_match_sklearn(predictions):
+    y_true, y_pred, _ = predictions
+    metrics = compute_metrics(y_true, y_pred)
+    assert len(metrics) == 1
+    expected = reference_metrics(y_true, y_pred)
+    for metric in METRICS:
+        assert metrics[metric][0] == pytest.approx(expected[metric])
+
+def test_grouped_metrics_match_per_group_computation(predictions):
+    y_true, y_pred, groups = predictions
+    metrics = compute_metrics(y_true, y_pred, groups)
+    assert set(metrics["group"]) == {"all", "Hour", "Seasons"}
+    for season in ["Winter", "Summer"]:
+        row = metrics[(metrics["group"] == "Seasons") & (metrics["level"] == season)].iloc[0]
+        mask = (groups["Seasons"] == season).to_numpy()
+        expected = reference_metrics(y_true[mask], y_pred[mask])
+        assert row["n"] == mask.sum()
+        for metric in METRICS:
+            assert row[metric] == pytest.approx(expected[metric])
+
+def test_undefined_metrics_are_nan():
+    metrics = grouped_metrics(np.array([0, 0, 5, 7]), np.array([1, 2, 5, 8]), np.array([0, 0, 1, 1]), 2)
+    assert np.isnan(metrics["r2"][0])
+    assert np.isnan(metrics["mape"][0])
+    assert metrics["rmse"][0] == pytest.approx(np.sqrt(2.5))
+
+def test_negative_predictions_are_clipped_for_rmsle():
+    metrics = grouped_metrics(np.array([0.0, 0.0]), np.array([-5.0, -1.0]), np.zeros(2, dtype=int), 1)
+    assert metrics["rmsle"][0] == 0
+
+def test_missing_group_values_raise():
+    with pytest.raises(ValueError):
+        compute_metrics(np.ones(2), np.ones(2), pd.DataFrame({"Hour": [1, None]}))
+
+def test_metrics_table_is_tidy(predictions):
+    y_true, y_pred, groups = predictions
+    table = metrics_table(y_true, {"ridge": y_pred, "tree": y_true}, groups)
+    assert list(table.columns) == ["model", "group", "level", "n"] + METRICS
+    assert len(table) == 2 * (1 + 24 + 4)
+    perfect = table[(table["model"] == "tree") & (table["group"] == "all")].iloc[0]
+    assert perfect["rmse"] == 0 and perfect["r2"] == 1
@@ -10,6 +10,8 @@ from src.model_evaluation import (
     evaluate_model,
     save_results,
     generate_prediction_plot,
+    predict_models,
+    main_logic,
 )
 
 
@@ -88,4 +90,38 @@ def test_generate_prediction_plot(setup_test_environment):
     y_test = data["Rented Bike Count"]
     output_file = tmp_path / "plot.png"
     generate_prediction_plot(model, X_test, y_test, str(output_file))
-    assert os.path.isfile(output_file), "Prediction plot should be created"
\ No newline at end of file
+    assert os.path.isfile(output_file), "Prediction plot should be created"
+
+class CountingRegressor(DummyRegressor):
+    """DummyRegressor counting its predict calls."""
+    n_predict_calls = 0
+
+    def predict(self, X, return_std=False):
+        CountingRegressor.n_predict_calls += 1
+        return super().predict(X, return_std=return_std)
+
+
+def test_reused_predictions_skip_predict(setup_test_environment):
+    test_data_path, _, _, tmp_path = setup_test_environment
+    data = load_data(str(test_data_path))
+    X_test = data.drop("Rented Bike Count", axis=1)
+    y_test = data["Rented Bike Count"]
+    model = CountingRegressor().fit(X_test, y_test)
+    CountingRegressor.n_predict_calls = 0
+
+    y_pred = predict_models({"dummy": model}, X_test)["dummy"]
+    score = evaluate_model(model, X_test, y_test, y_pred=y_pred)
+    generate_prediction_plot(model, X_test, y_test, str(tmp_path / "plot.png"), y_pred=y_pred)
+    assert CountingRegressor.n_predict_calls == 1, "Each model should predict the test set once"
+    assert score == pytest.approx(model.score(X_test, y_test))
+
+
+def test_main_logic(setup_test_environment):
+    test_data_path, ridge_model_path, tree_model_path, tmp_path = setup_test_environment
+    main_logic(str(test_data_path), str(ridge_model_path), str(tree_model_path),
+               str(tmp_path), str(tmp_path))
+    results = pd.read_csv(tmp_path / "test_scores.csv")
+    assert results["accuracy_ridge"][0] == pytest.approx(0.0)
+    assert results["accuracy_tree"][0] == pytest.approx(0.0)
+    assert os.path.isfile(tmp_path / "prediction_error_ridge.png")
+    assert os.path.isfile(tmp_path / "prediction_error_tree.png")
@@ -0,0 +1,43 @@
+# tests/test_model_export.py
+import pytest
+import os
+import pickle
+import sys
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.model_export import export_best_estimator, load_search_metadata
+from src.model_evaluation import load_pipeline
+
+TEST_DATA = "data/processed/bike_test.csv"
+
+@pytest.fixture(scope="module")
+def test_features():
+    set_config(transform_output="pandas")
+    return pd.read_csv(TEST_DATA).drop("Rented Bike Count", axis=1)
+
+@pytest.mark.parametrize("name", ["ridge", "tree"])
+def test_exported_model_predicts_like_search(tmp_path, test_features, name):
+    with open(f"results/models/{name}_pipeline.pickle", "rb") as f:
+        search = pickle.load(f)
+    model_path, metadata_path = export_best_estimator(search, tmp_path, name)
+
+    model = load_pipeline(model_path)
+    assert not hasattr(model, "cv_results_")
+    np.testing.assert_allclose(model.predict(test_features), search.predict(test_features))
+
+    metadata = load_search_metadata(metadata_path)
+    assert metadata["best_params"] == search.best_params_
+    assert metadata["best_score"] == pytest.approx(search.best_score_)
+    assert metadata["n_candidates"] == 10
+    assert metadata["n_splits"] == 10
+
+def test_exported_arrays_are_memory_mapped(tmp_path):
+    with open("results/models/ridge_pipeline.pickle", "rb") as f:
+        search = pickle.load(f)
+    model_path, _ = export_best_estimator(search, tmp_path, "ridge")
+    model = load_pipeline(model_path)
+    assert isinstance(model[-1].coef_, np.memmap)
+    assert not model[-1].coef_.flags.writeable
+    assert os.path.getsize(model_path) < os.path.getsize("results/models/ridge_pipeline.pickle")
@@ -0,0 +1,45 @@
+# tests/test_predict.py
+import pytest
+import os
+import pickle
+import sys
+import numpy as np
+import pandas as pd
+from sklearn import set_config
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.predict import predict_in_chunks, PREDICTION
+from src.processed_data import write_processed
+
+TEST_DATA = "data/processed/bike_test.csv"
+PIPELINE_PATH = "results/models/ridge_pipeline.pickle"
+
+@pytest.fixture(scope="module")
+def expected_predictions():
+    set_config(transform_output="pandas")
+    test_data = pd.read_csv(TEST_DATA)
+    with open(PIPELINE_PATH, "rb") as f:
+        pipeline = pickle.load(f)
+    return pipeline.predict(test_data.drop("Rented Bike Count", axis=1))
+
+def test_predictions_match_full_scoring(tmp_path, expected_predictions):
+    output_path = tmp_path / "predictions.csv"
+    stats = predict_in_chunks(PIPELINE_PATH, TEST_DATA, output_path, chunksize=1000)
+    predictions = pd.read_csv(output_path)[PREDICTION].to_numpy()
+    np.testing.assert_allclose(predictions, expected_predictions)
+    assert stats["rows"] == len(expected_predictions)
+    assert stats["chunks"] == 3
+    assert stats["rows_per_sec"] > 0
+
+def test_parallel_predictions_keep_order(tmp_path, expected_predictions):
+    output_path = tmp_path / "predictions.csv"
+    predict_in_chunks(PIPELINE_PATH, TEST_DATA, output_path, chunksize=300, n_jobs=2)
+    predictions = pd.read_csv(output_path)[PREDICTION].to_numpy()
+    np.testing.assert_allclose(predictions, expected_predictions)
+
+def test_parquet_features(tmp_path, expected_predictions):
+    parquet_path = tmp_path / "bike_test.parquet"
+    write_processed(pd.read_csv(TEST_DATA), parquet_path)
+    output_path = tmp_path / "predictions.csv"
+    predict_in_chunks(PIPELINE_PATH, parquet_path, output_path, chunksize=1000)
+    predictions = pd.read_csv(output_path)[PREDICTION].to_numpy()
+    np.testing.assert_allclose(predictions, expected_predictions)
@@ -0,0 +1,47 @@
+# tests/test_processed_data.py
+import pytest
+import os
+import sys
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.processed_data import read_processed, write_processed, is_parquet, iter_processed
+
+SAMPLE_DATA = "data/processed/test_sample/sample.csv"
+
+@pytest.fixture
+def processed_data():
+    return pd.read_csv(SAMPLE_DATA)
+
+@pytest.mark.parametrize("file_name", ["bike.csv", "bike.parquet"])
+def test_round_trip(processed_data, tmp_path, file_name):
+    file_path = tmp_path / file_name
+    write_processed(processed_data, file_path)
+    loaded = read_processed(file_path)
+    assert list(loaded.columns) == list(processed_data.columns), "Columns should be preserved."
+    assert len(loaded) == len(processed_data), "All rows should be preserved."
+
+def test_parquet_uses_explicit_schema(processed_data, tmp_path):
+    # Rainfall and Snowfall are whole numbers in the sample, so CSV infers them as integers
+    file_path = tmp_path / "bike.parquet"
+    write_processed(processed_data, file_path)
+    loaded = read_processed(file_path)
+    assert loaded["Rainfall"].dtype == "float64", "Rainfall should follow the schema type."
+    assert loaded["Hour"].dtype == "int64", "Hour should follow the schema type."
+
+def test_column_selection(processed_data, tmp_path):
+    file_path = tmp_path / "bike.parquet"
+    write_processed(processed_data, file_path)
+    loaded = read_processed(file_path, columns=["Hour", "Rented Bike Count"])
+    assert list(loaded.columns) == ["Hour", "Rented Bike Count"], "Only the selected columns should be read."
+
+def test_is_parquet():
+    assert is_parquet("data/processed/bike_train.parquet")
+    assert not is_parquet("data/processed/bike_train.csv")
+
+@pytest.mark.parametrize("file_name", ["bike.csv", "bike.parquet"])
+def test_iter_processed(processed_data, tmp_path, file_name):
+    file_path = tmp_path / file_name
+    write_processed(processed_data, file_path)
+    chunks = list(iter_processed(file_path, chunksize=25))
+    assert [len(chunk) for chunk in chunks] == [25, 25, 12], "The file should be read in chunks of rows."
+    assert list(chunks[0].columns) == list(processed_data.columns)
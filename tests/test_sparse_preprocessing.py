@@ -0,0 +1,47 @@
+# tests/test_sparse_preprocessing.py
+import pytest
+import pickle
+import os
+import sys
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn import set_config
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.sparse_preprocessing import make_sparse_preprocessor, matrix_nbytes, sparse_memory_report
+
+TRAINING_DATA = "data/processed/test_sample/sample.csv"
+PREPROCESSOR_PATH = "results/models/bike_preprocessor.pickle"
+
+@pytest.fixture
+def features_and_preprocessor():
+    set_config(transform_output="pandas")
+    features = pd.read_csv(TRAINING_DATA).drop("Rented Bike Count", axis=1)
+    with open(PREPROCESSOR_PATH, "rb") as f:
+        preprocessor = pickle.load(f)
+    return features, preprocessor
+
+def test_sparse_preprocessor_outputs_csr(features_and_preprocessor):
+    features, preprocessor = features_and_preprocessor
+    transformed = make_sparse_preprocessor(preprocessor).fit_transform(features)
+    assert sparse.isspmatrix_csr(transformed), "The sparse preprocessor should output a CSR matrix."
+
+def test_sparse_matches_dense(features_and_preprocessor):
+    features, preprocessor = features_and_preprocessor
+    sparse_matrix = make_sparse_preprocessor(preprocessor).fit_transform(features)
+    dense_matrix = preprocessor.fit_transform(features)
+    np.testing.assert_allclose(sparse_matrix.toarray(), dense_matrix.to_numpy())
+
+def test_original_preprocessor_untouched(features_and_preprocessor):
+    _, preprocessor = features_and_preprocessor
+    make_sparse_preprocessor(preprocessor)
+    assert preprocessor.get_params()["onehotencoder__sparse_output"] is False, \
+        "The dense preprocessor should not be modified."
+
+def test_sparse_memory_report():
+    matrix = sparse.csr_matrix(np.eye(10))
+    report = sparse_memory_report(matrix)
+    assert report["dense_bytes"] == 800
+    assert report["sparse_bytes"] == matrix_nbytes(matrix)
+    assert report["saved_bytes"] == report["dense_bytes"] - report["sparse_bytes"]
+    assert report["density"] == pytest.approx(0.1)
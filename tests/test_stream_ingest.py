@@ -0,0 +1,85 @@
+# tests/test_stream_ingest.py
+import pytest
+import os
+import sys
+import zipfile
+import threading
+import functools
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import pandas as pd
+import pandera as pa
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.stream_ingest import read_zip_streaming, validate_csv_in_chunks
+
+RAW_DATA = "data/raw/SeoulBikeData.csv"
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    # first 500 rows of the Seoul data
+    csv_path = tmp_path / "SeoulBikeData.csv"
+    pd.read_csv(RAW_DATA, encoding="ISO-8859-1", nrows=500).to_csv(csv_path, index=False, encoding="ISO-8859-1")
+    return csv_path
+
+@pytest.fixture
+def raw_zip(tmp_path, raw_csv):
+    zip_path = tmp_path / "seoul_bike.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        z.write(raw_csv, arcname="SeoulBikeData.csv")
+    return zip_path
+
+@pytest.fixture
+def http_server(tmp_path):
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def test_read_zip_from_file_url(raw_zip, tmp_path):
+    csv_path = read_zip_streaming(raw_zip.as_uri(), tmp_path / "raw", chunk_size=1024)
+    assert os.path.isfile(csv_path), "The CSV file should be extracted."
+    assert [f for f in os.listdir(tmp_path / "raw") if f.endswith(".zip")] == [], "The spooled archive should be removed."
+
+def test_read_zip_from_http(raw_zip, tmp_path, http_server):
+    csv_path = read_zip_streaming(f"{http_server}/{raw_zip.name}", tmp_path / "raw", chunk_size=1024)
+    assert len(pd.read_csv(csv_path, encoding="ISO-8859-1")) == 500, "All rows should be downloaded."
+
+def test_read_zip_rejects_non_zip(raw_csv, tmp_path):
+    with pytest.raises(ValueError):
+        read_zip_streaming(raw_csv.as_uri(), tmp_path / "raw")
+
+def test_validate_in_chunks(raw_csv):
+    sample, summary = validate_csv_in_chunks(raw_csv, chunksize=64, sample_size=100)
+    assert summary["n_rows"] == 500
+    assert summary["n_chunks"] == 8
+    assert len(sample) == 100, "The sample should be bounded by sample_size."
+
+def test_sample_is_reproducible(raw_csv):
+    first, _ = validate_csv_in_chunks(raw_csv, chunksize=64, sample_size=100, seed=1)
+    second, _ = validate_csv_in_chunks(raw_csv, chunksize=64, sample_size=100, seed=1)
+    pd.testing.assert_frame_equal(first, second)
+
+def test_duplicates_across_chunks(raw_csv, tmp_path):
+    df = pd.read_csv(raw_csv, encoding="ISO-8859-1")
+    duplicated_path = tmp_path / "duplicated.csv"
+    pd.concat([df, df.iloc[[0]]]).to_csv(duplicated_path, index=False, encoding="ISO-8859-1")
+    with pytest.raises(ValueError, match="Duplicate rows"):
+        validate_csv_in_chunks(duplicated_path, chunksize=64)
+
+def test_rainfall_null_fraction(raw_csv, tmp_path):
+    df = pd.read_csv(raw_csv, encoding="ISO-8859-1")
+    df.loc[:49, "Rainfall(mm)"] = None
+    missing_path = tmp_path / "missing.csv"
+    df.to_csv(missing_path, index=False, encoding="ISO-8859-1")
+    with pytest.raises(ValueError, match="Rainfall"):
+        validate_csv_in_chunks(missing_path, chunksize=64)
+
+def test_invalid_chunk(raw_csv, tmp_path):
+    df = pd.read_csv(raw_csv, encoding="ISO-8859-1")
+    df.loc[450, "Hour"] = 30
+    invalid_path = tmp_path / "invalid.csv"
+    df.to_csv(invalid_path, index=False, encoding="ISO-8859-1")
+    with pytest.raises(pa.errors.SchemaErrors):
+        validate_csv_in_chunks(invalid_path, chunksize=64)
@@ -0,0 +1,64 @@
+# tests/test_transform_cache.py
+import pytest
+import copy
+import pickle
+import os
+import sys
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.transform_cache import TransformCache
+
+@pytest.fixture
+def fold_data():
+    return pd.DataFrame({
+        'Hour': [0, 1, 2, 3],
+        'Seasons': ['Winter', 'Winter', 'Spring', 'Summer'],
+        'Temperature': [-5.2, -5.5, 10.1, 25.3]
+    })
+
+def make_counting_function():
+    calls = []
+    def fit_transform(X, scale=1):
+        calls.append(1)
+        return X.assign(Temperature=X['Temperature'] * scale)
+    return fit_transform, calls
+
+def test_repeated_calls_are_computed_once(fold_data):
+    cache = TransformCache()
+    func, calls = make_counting_function()
+    cached_func = cache.cache(func)
+    first = cached_func(fold_data, scale=2)
+    second = cached_func(fold_data.copy(), scale=2)
+    assert len(calls) == 1, "The function should only run once for identical inputs."
+    assert first is second, "The cached result should be reused."
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_different_inputs_are_not_shared(fold_data):
+    cache = TransformCache()
+    func, calls = make_counting_function()
+    cached_func = cache.cache(func)
+    cached_func(fold_data, scale=2)
+    cached_func(fold_data.iloc[:2], scale=2)
+    cached_func(fold_data, scale=3)
+    assert len(calls) == 3, "Different data or parameters should not hit the cache."
+
+def test_deepcopy_shares_cache():
+    cache = TransformCache()
+    assert copy.deepcopy(cache) is cache, "Cloned pipelines should share the same cache."
+
+def test_pickle_drops_in_memory_store(fold_data):
+    cache = TransformCache()
+    func, _ = make_counting_function()
+    cache.cache(func)(fold_data)
+    restored = pickle.loads(pickle.dumps(cache))
+    assert restored._store == {}, "The in-memory store should not be pickled."
+
+def test_disk_cache_is_shared_between_instances(fold_data, tmp_path):
+    func, calls = make_counting_function()
+    TransformCache(str(tmp_path)).cache(func)(fold_data)
+    other_cache = TransformCache(str(tmp_path))
+    result = other_cache.cache(func)(fold_data)
+    assert len(calls) == 1, "The on-disk cache should be reused by a new instance."
+    pd.testing.assert_frame_equal(result, fold_data)
+    other_cache.clear()
+    assert not any(file.endswith(".joblib") for file in os.listdir(tmp_path)), "clear() should remove cached files."